@@ -0,0 +1,57 @@
+"""Benchmark `get_recurrences_bulk()` against looping `get_recurrences()`.
+
+Usage: python benchmarks/bench_bulk.py
+"""
+import datetime
+import icemac.recurrence
+import pytz
+import timeit
+import zope.configuration.xmlconfig
+
+
+PERIODS = [
+    'daily',
+    'weekly',
+    'biweekly',
+    'nth weekday of month',
+    'nth weekday every other month',
+    'nth weekday from end of month',
+    'nth weekday from end of other month',
+    'yearly',
+]
+EVENTS = 20000
+NUMBER = 3
+
+
+def make_events():
+    base = pytz.utc.localize(datetime.datetime(2015, 1, 1, 10))
+    return [(index,
+             base + datetime.timedelta(hours=index),
+             PERIODS[index % len(PERIODS)])
+            for index in range(EVENTS)]
+
+
+def loop(events, start, end):
+    for key, dt, period in events:
+        for recurrence in icemac.recurrence.get_recurrences(
+                dt, period, start, end):
+            yield key, recurrence
+
+
+def main():
+    zope.configuration.xmlconfig.file('configure.zcml', icemac.recurrence)
+    events = make_events()
+    # A short interval, so the lookup overhead is significant:
+    start = pytz.utc.localize(datetime.datetime(2019, 6, 3))
+    end = pytz.utc.localize(datetime.datetime(2019, 6, 4))
+    for name, func in [('get_recurrences', loop),
+                       ('get_recurrences_bulk',
+                        icemac.recurrence.get_recurrences_bulk)]:
+        duration = timeit.timeit(
+            lambda: list(func(events, start, end)), number=NUMBER)
+        print('{:<22} {:8.2f} us per event'.format(
+            name, duration / NUMBER / EVENTS * 1e6))
+
+
+if __name__ == '__main__':
+    main()
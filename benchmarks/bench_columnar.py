@@ -0,0 +1,63 @@
+"""Compare the memory of lists of datetimes and `EpochRecurrences`.
+
+Usage: python3 benchmarks/bench_columnar.py
+"""
+from icemac.recurrence import columnar, get_recurrences_bulk
+import datetime
+import gc
+import icemac.recurrence
+import pytz
+import time
+import tracemalloc
+import zope.configuration.xmlconfig
+
+
+EVENTS = 2000
+PERIODS = ['daily', 'weekly', 'nth weekday of month']
+
+
+def make_events():
+    tz = pytz.timezone('Europe/Berlin')
+    base = datetime.datetime(2015, 1, 1, 10)
+    return [(index, tz.localize(base + datetime.timedelta(hours=index)),
+             PERIODS[index % len(PERIODS)])
+            for index in range(EVENTS)]
+
+
+def measure(func):
+    """Return the result of `func`, its duration and its memory in bytes.
+
+    The duration is measured without tracing the memory allocations.
+    """
+    gc.collect()
+    begin = time.perf_counter()
+    func()
+    duration = time.perf_counter() - begin
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, duration, memory
+
+
+def main():
+    zope.configuration.xmlconfig.file('configure.zcml', icemac.recurrence)
+    events = make_events()
+    start = pytz.utc.localize(datetime.datetime(2019, 6, 1))
+    end = pytz.utc.localize(datetime.datetime(2020, 12, 1))
+    for name, func in [
+            ('list of datetimes',
+             lambda: list(get_recurrences_bulk(events, start, end))),
+            ('EpochRecurrences',
+             lambda: columnar.get_recurrences_bulk(events, start, end))]:
+        result, duration, memory = measure(func)
+        print('{:<18} {:>8} recurrences {:8.2f} s {:8.1f} MB '
+              '{:6.1f} bytes per recurrence'.format(
+                  name, len(result), duration, memory / 2 ** 20,
+                  memory / len(result)))
+        del result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark the startup time needed to compute the first recurrences.
+
+Compares the plain Python core with the adapters registered via ZCML. Each
+variant runs in a fresh Python process.
+
+Usage: python benchmarks/bench_import.py
+"""
+import subprocess
+import sys
+import timeit
+
+
+NUMBER = 5
+
+COMPUTE = """
+import datetime
+import pytz
+dt = pytz.utc.localize(datetime.datetime(2019, 6, 3, 10))
+end = pytz.utc.localize(datetime.datetime(2019, 7, 1))
+list(get_recurrences(dt, 'weekly', dt, end))
+"""
+
+VARIANTS = [
+    ('core', """
+from icemac.recurrence.core import get_recurrences
+""" + COMPUTE),
+    ('ZCML', """
+from icemac.recurrence import get_recurrences
+import icemac.recurrence
+import zope.configuration.xmlconfig
+zope.configuration.xmlconfig.file('configure.zcml', icemac.recurrence)
+""" + COMPUTE),
+]
+
+
+def main():
+    baseline = timeit.timeit(
+        lambda: subprocess.check_call([sys.executable, '-c', 'pass']),
+        number=NUMBER) / NUMBER
+    for name, code in VARIANTS:
+        duration = timeit.timeit(
+            lambda: subprocess.check_call([sys.executable, '-c', code]),
+            number=NUMBER) / NUMBER
+        print('{:<5} {:8.1f} ms (without interpreter startup)'.format(
+            name, (duration - baseline) * 1000))
+
+
+if __name__ == '__main__':
+    main()
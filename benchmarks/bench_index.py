@@ -0,0 +1,55 @@
+"""Benchmark `RecurrenceIndex.query()` against checking each event.
+
+Usage: python benchmarks/bench_index.py [number of events]
+"""
+from icemac.recurrence.core import PERIODS
+from icemac.recurrence.index import RecurrenceIndex
+import datetime
+import pytz
+import random
+import sys
+import time
+
+
+EVENTS = 1000000
+
+
+def make_events(number):
+    rand = random.Random(4711)
+    base = pytz.utc.localize(datetime.datetime(2000, 1, 1, 10))
+    periods = sorted(PERIODS)
+    return [(index,
+             base + datetime.timedelta(days=rand.randint(0, 7000)),
+             rand.choice(periods))
+            for index in range(number)]
+
+
+def loop(events, start, end):
+    return [key for key, dt, period in events
+            if PERIODS[period](dt).count(start, end)]
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else EVENTS
+    events = make_events(number)
+    start = pytz.utc.localize(datetime.datetime(2019, 6, 3))
+    end = pytz.utc.localize(datetime.datetime(2019, 6, 10))
+
+    begin = time.time()
+    index = RecurrenceIndex()
+    for event in events:
+        index.add(*event)
+    print('add {} events:   {:8.2f} s'.format(number, time.time() - begin))
+
+    begin = time.time()
+    result = index.query(start, end)
+    print('query one week:   {:8.2f} s'.format(time.time() - begin))
+
+    begin = time.time()
+    expected = loop(events, start, end)
+    print('check each event: {:8.2f} s'.format(time.time() - begin))
+    assert sorted(expected) == sorted(result)
+
+
+if __name__ == '__main__':
+    main()
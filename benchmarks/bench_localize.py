@@ -0,0 +1,31 @@
+"""Benchmark `Localizer` against calling `tz.localize()` for each datetime.
+
+Usage: python benchmarks/bench_localize.py
+"""
+from icemac.recurrence.core import Localizer
+import datetime
+import pytz
+import timeit
+
+
+NUMBER = 5
+
+
+def main():
+    tz = pytz.timezone('Europe/Berlin')
+    start = datetime.datetime(1950, 1, 6, 10)
+    # Weekly local times for 100 years:
+    walls = [start + datetime.timedelta(weeks=x) for x in range(5218)]
+    assert ([tz.localize(x) for x in walls] ==
+            [Localizer(tz)(x) for x in walls])
+    for name, func in [('tz.localize', lambda: tz.localize),
+                       ('Localizer', lambda: Localizer(tz))]:
+        duration = timeit.timeit(
+            lambda: [localize(x) for localize in [func()] for x in walls],
+            number=NUMBER)
+        print('{:<12} {:8.2f} us per datetime'.format(
+            name, duration / NUMBER / len(walls) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""Benchmark the adapter lookup of `get_recurring()`.
+
+Compares the cached lookup with a lookup in the component registry.
+
+Usage: python benchmarks/bench_lookup.py
+"""
+from icemac.recurrence.interfaces import IRecurringDateTime
+import datetime
+import icemac.recurrence
+import pytz
+import timeit
+import zope.component
+import zope.configuration.xmlconfig
+
+
+NUMBER = 100000
+
+
+def main():
+    zope.configuration.xmlconfig.file('configure.zcml', icemac.recurrence)
+    dt = pytz.utc.localize(datetime.datetime(2019, 6, 3, 10))
+    for name, func in [
+            ('zope.component.getAdapter',
+             lambda: zope.component.getAdapter(
+                 dt, IRecurringDateTime, name='weekly')),
+            ('get_recurring',
+             lambda: icemac.recurrence.get_recurring(dt, 'weekly'))]:
+        duration = timeit.timeit(func, number=NUMBER)
+        print('{:<26} {:8.3f} us per call'.format(
+            name, duration / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
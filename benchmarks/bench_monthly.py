@@ -0,0 +1,33 @@
+"""Benchmark the expansion of the monthly periods over 100 years.
+
+Usage: python benchmarks/bench_monthly.py
+"""
+from icemac.recurrence import core
+import datetime
+import pytz
+import timeit
+
+
+PERIODS = [
+    'nth weekday of month',
+    'nth weekday every other month',
+    'nth weekday from end of month',
+    'nth weekday from end of other month',
+]
+NUMBER = 20
+
+
+def main():
+    base = pytz.utc.localize(datetime.datetime(1950, 1, 6, 10))
+    start = pytz.utc.localize(datetime.datetime(1950, 1, 1))
+    end = pytz.utc.localize(datetime.datetime(2050, 1, 1))
+    for period in PERIODS:
+        recurring = core.PERIODS[period](base)
+        duration = timeit.timeit(
+            lambda: list(recurring(start, end)), number=NUMBER)
+        print('{:<36} {:8.2f} ms per expansion'.format(
+            period, duration / NUMBER * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""Benchmark `occurs_on()` against expanding the recurrences of the day.
+
+Usage: python benchmarks/bench_occurs_on.py
+"""
+from icemac.recurrence.core import PERIODS
+import datetime
+import pytz
+import timeit
+
+
+NUMBER = 20000
+
+
+def expand(recurring, date):
+    start = pytz.utc.localize(datetime.datetime.combine(date, datetime.time()))
+    return any(True for x in recurring(start, start + datetime.timedelta(1)))
+
+
+def main():
+    base = pytz.utc.localize(datetime.datetime(2015, 1, 6, 10))
+    date = datetime.date(2019, 6, 4)
+    for period in sorted(PERIODS):
+        recurring = PERIODS[period](base)
+        assert expand(recurring, date) == recurring.occurs_on(date)
+        for name, func in [('expand', expand),
+                           ('occurs_on', type(recurring).occurs_on)]:
+            duration = timeit.timeit(
+                lambda: func(recurring, date), number=NUMBER)
+            print('{:<36} {:<10} {:8.2f} us per call'.format(
+                period, name, duration / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
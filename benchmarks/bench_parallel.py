@@ -0,0 +1,48 @@
+"""Benchmark `icemac.recurrence.parallel.expand()` on 1, 2, 4 and 8 cores.
+
+Usage: python3 benchmarks/bench_parallel.py
+"""
+from icemac.recurrence import columnar, parallel
+from icemac.recurrence.core import PERIODS
+import datetime
+import os
+import pytz
+import time
+
+
+EVENTS = 20000
+WORKERS = [1, 2, 4, 8]
+
+
+def make_events():
+    zones = [pytz.utc, pytz.timezone('Europe/Berlin'),
+             pytz.timezone('America/New_York')]
+    periods = sorted(PERIODS)
+    base = datetime.datetime(2015, 1, 1, 10)
+    return [(zones[index % len(zones)].localize(
+                base + datetime.timedelta(hours=index)),
+             periods[index % len(periods)])
+            for index in range(EVENTS)]
+
+
+def main():
+    events = make_events()
+    # The next 18 months:
+    start = pytz.utc.localize(datetime.datetime(2019, 6, 1))
+    end = pytz.utc.localize(datetime.datetime(2020, 12, 1))
+    print('{} CPUs, {} events'.format(os.cpu_count(), EVENTS))
+    begin = time.perf_counter()
+    result = columnar.expand(events, start, end)
+    serial = time.perf_counter() - begin
+    print('{:<10} {:8.2f} s {:>10} recurrences'.format(
+        'serial', serial, len(result)))
+    for workers in WORKERS:
+        begin = time.perf_counter()
+        parallel.expand(events, start, end, max_workers=workers)
+        duration = time.perf_counter() - begin
+        print('{:<10} {:8.2f} s {:8.2f}x'.format(
+            '{} workers'.format(workers), duration, serial / duration))
+
+
+if __name__ == '__main__':
+    main()
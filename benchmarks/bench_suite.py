@@ -0,0 +1,131 @@
+"""Benchmark the computation of the recurrences of all periods.
+
+The cases combine each period with a short and a long interval, an old and a
+new recurrence start and a time zone without and with DST. Additional cases
+measure the overhead of looking up the adapter in `get_recurrences()`.
+
+Usage: python3 benchmarks/bench_suite.py [-k SUBSTRING] [--save FILE]
+                                         [--compare FILE] [--threshold 1.2]
+
+The results are stored as ratios to the time of a reference case measured
+in the same run, which only uses the standard library. So the baselines
+mostly do not depend on the speed of the machine. `--save` stores the
+results as baseline, `--compare` compares the results with a stored baseline
+and exits with status 1 if a case got slower than `--threshold` times its
+baseline.
+"""
+import argparse
+import datetime
+import icemac.recurrence
+import json
+import pytz
+import sys
+import timeit
+import zope.configuration.xmlconfig
+
+
+PERIODS = [
+    'daily',
+    'weekly',
+    'biweekly',
+    'nth weekday of month',
+    'nth weekday every other month',
+    'nth weekday from end of month',
+    'nth weekday from end of other month',
+    'yearly',
+]
+INTERVAL_START = datetime.datetime(2019, 6, 3)
+INTERVALS = [('short', datetime.timedelta(days=7)),
+             ('long', datetime.timedelta(days=3 * 365))]
+STARTS = [('old', datetime.datetime(1980, 3, 12, 10, 30)),
+          ('new', datetime.datetime(2019, 5, 15, 10, 30))]
+ZONES = ['UTC', 'Europe/Berlin']
+REPEAT = 3
+REFERENCE_DAYS = [datetime.timedelta(days=x) for x in range(1000)]
+
+
+def reference():
+    """Case measuring the speed of the machine without icemac.recurrence."""
+    tz = pytz.utc
+    start = tz.localize(INTERVAL_START)
+    return [x for x in (start + y for y in REFERENCE_DAYS) if x.weekday()]
+
+
+def make_cases():
+    """Return a list of (name, function) tuples."""
+    cases = []
+    for zone in ZONES:
+        tz = pytz.timezone(zone)
+        start = tz.localize(INTERVAL_START)
+        for start_name, wall in STARTS:
+            dt = tz.localize(wall)
+            for period in PERIODS:
+                recurring = icemac.recurrence.get_recurring(dt, period)
+                for interval_name, length in INTERVALS:
+                    name = '{} {} {} {}'.format(
+                        period, interval_name, start_name, zone)
+                    cases.append((name, (
+                        lambda recurring=recurring, start=start,
+                        end=start + length: list(recurring(start, end)))))
+    # The lookup overhead of `get_recurrences()`:
+    dt = pytz.utc.localize(STARTS[1][1])
+    start = pytz.utc.localize(INTERVAL_START)
+    end = start + INTERVALS[0][1]
+    recurring = icemac.recurrence.get_recurring(dt, 'weekly')
+    cases.append(('lookup adapter', lambda: list(recurring(start, end))))
+    cases.append(('lookup get_recurrences', lambda: list(
+        icemac.recurrence.get_recurrences(dt, 'weekly', start, end))))
+    return cases
+
+
+def measure(func):
+    """Return the seconds per call of `func`."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(REPEAT, number)) / number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-k', dest='substring', default='',
+                        help='only run the cases containing SUBSTRING')
+    parser.add_argument('--save', help='store the results in this file')
+    parser.add_argument('--compare', help='compare with the baseline file')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='maximum ratio to the baseline')
+    args = parser.parse_args(argv)
+    zope.configuration.xmlconfig.file('configure.zcml', icemac.recurrence)
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+    reference_seconds = measure(reference)
+    print('{:<60} {:10.2f} us'.format('reference', reference_seconds * 1e6))
+    results = {}
+    slower = []
+    for name, func in make_cases():
+        if args.substring not in name:
+            continue
+        seconds = measure(func)
+        results[name] = relative = seconds / reference_seconds
+        line = '{:<60} {:10.2f} us {:8.3f} ref'.format(
+            name, seconds * 1e6, relative)
+        if name in baseline:
+            ratio = relative / baseline[name]
+            line += ' {:6.2f}x'.format(ratio)
+            if ratio > args.threshold:
+                slower.append(name)
+                line += ' SLOWER'
+        print(line)
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+    if slower:
+        print('{} case(s) slower than {}x the baseline.'.format(
+            len(slower), args.threshold))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Benchmark the vectorized computation of recurrences with a fix interval.
+
+Compares `icemac.recurrence.vectorized` with the generators of the adapters
+for single events over long intervals and for many events at once.
+The generators are only measured for the small scenarios as they are too slow
+for the large ones.
+
+Usage: python benchmarks/bench_vectorized.py
+"""
+from icemac.recurrence import core
+from icemac.recurrence import vectorized
+import datetime
+import pytz
+import timeit
+
+
+NUMBER = 3
+tz_berlin = pytz.timezone('Europe/Berlin')
+MONTHLY = [
+    'nth weekday of month',
+    'nth weekday every other month',
+    'nth weekday from end of month',
+    'nth weekday from end of other month',
+]
+
+
+def localize(*args):
+    return tz_berlin.localize(datetime.datetime(*args))
+
+
+def generators(events, start, end):
+    return [x for context, period in events
+            for x in core.PERIODS[period](context)(start, end)]
+
+
+def main():
+    base = localize(2015, 3, 4, 10, 30)
+    scenarios = [
+        ('1 daily event, 10 years', [(base, 'daily')], 10),
+        ('1000 events, 1 year', [
+            (base + datetime.timedelta(hours=x),
+             ['daily', 'weekly', 'biweekly'][x % 3]) for x in range(1000)], 1),
+        ('1000 monthly events, 10 years', [
+            (base + datetime.timedelta(hours=x), MONTHLY[x % 4])
+            for x in range(1000)], 10),
+        ('50000 monthly events, 10 years', [
+            (base + datetime.timedelta(hours=x), MONTHLY[x % 4])
+            for x in range(50000)], 10),
+    ]
+    for name, events, years in scenarios:
+        start = localize(2019, 1, 1)
+        end = localize(2019 + years, 1, 1)
+        print(name)
+        variants = [
+                ('generators', generators),
+                ('vectorized', vectorized.compute_many),
+                ('vectorized + datetimes',
+                 lambda *args: vectorized.compute_many(*args).datetimes())]
+        if len(events) > 1000:
+            variants = variants[1:2]
+        for variant, func in variants:
+            duration = timeit.timeit(
+                lambda: func(events, start, end), number=NUMBER)
+            print('    {:<24} {:10.2f} ms'.format(
+                variant, duration / NUMBER * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark scrolling a calendar with `RecurrenceWindow`.
+
+It compares moving the window week by week with computing the recurrences
+of each new interval from scratch in a new window.
+
+Usage: python3 benchmarks/bench_window.py
+"""
+from icemac.recurrence.window import RecurrenceWindow
+import datetime
+import icemac.recurrence
+import pytz
+import time
+import zope.configuration.xmlconfig
+
+
+EVENTS = 2000
+WEEKS = 26
+WINDOW = datetime.timedelta(weeks=6)
+PERIODS = [
+    'daily',
+    'weekly',
+    'biweekly',
+    'nth weekday of month',
+    'nth weekday from end of month',
+    'yearly',
+]
+
+
+def make_events():
+    tz = pytz.timezone('Europe/Berlin')
+    base = datetime.datetime(2015, 1, 1, 10)
+    return [(index, tz.localize(base + datetime.timedelta(hours=index)),
+             PERIODS[index % len(PERIODS)])
+            for index in range(EVENTS)]
+
+
+def main():
+    zope.configuration.xmlconfig.file('configure.zcml', icemac.recurrence)
+    events = make_events()
+    start = pytz.utc.localize(datetime.datetime(2019, 6, 3))
+    intervals = [(start + datetime.timedelta(weeks=x),
+                  start + datetime.timedelta(weeks=x) + WINDOW)
+                 for x in range(WEEKS)]
+    print('{} events, {} weeks window, {} moves by one week'.format(
+        EVENTS, WINDOW.days // 7, WEEKS - 1))
+
+    begin = time.perf_counter()
+    for interval in intervals:
+        RecurrenceWindow(events).move(*interval)
+    scratch = time.perf_counter() - begin
+    print('{:<20} {:8.3f} s'.format('from scratch', scratch))
+
+    window = RecurrenceWindow(events)
+    begin = time.perf_counter()
+    for interval in intervals:
+        window.move(*interval)
+    moved = time.perf_counter() - begin
+    print('{:<20} {:8.3f} s {:8.2f}x'.format(
+        'RecurrenceWindow', moved, scratch / moved))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""Benchmark the seek of the first date in `Yearly.compute()`.
+
+The time needed to compute the recurrences within one year should not depend
+on how long ago the recurrence started.
+
+Usage: python benchmarks/bench_yearly.py
+"""
+from icemac.recurrence.yearly import Yearly
+import datetime
+import pytz
+import timeit
+
+
+NUMBER = 10000
+
+
+def main():
+    start = pytz.utc.localize(datetime.datetime(2019, 1, 1))
+    end = pytz.utc.localize(datetime.datetime(2020, 1, 1))
+    for years_back in (1, 10, 100, 500):
+        base = pytz.utc.localize(
+            datetime.datetime(2019 - years_back, 12, 24, 15))
+        adapter = Yearly(base)
+        duration = timeit.timeit(
+            lambda: list(adapter(start, end)), number=NUMBER)
+        print('{:>4} years back: {:8.2f} us per call'.format(
+            years_back, duration / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Benchmark the recurrences of pytz and `zoneinfo` time zones.
+
+Usage: python3 benchmarks/bench_zoneinfo.py (requires Python 3.9+)
+"""
+from icemac.recurrence.core import PERIODS
+import datetime
+import pytz
+import timeit
+import zoneinfo
+
+
+NUMBER = 10
+ZONE = 'Europe/Berlin'
+
+
+def main():
+    wall = datetime.datetime(1990, 1, 6, 10)
+    start = pytz.utc.localize(datetime.datetime(1990, 1, 1))
+    end = pytz.utc.localize(datetime.datetime(2030, 1, 1))
+    for period in ('daily', 'weekly', 'nth weekday of month', 'yearly'):
+        for name, context in [
+                ('pytz', pytz.timezone(ZONE).localize(wall)),
+                ('zoneinfo', wall.replace(tzinfo=zoneinfo.ZoneInfo(ZONE))),
+                ('naive', wall)]:
+            if context.tzinfo is None:
+                bounds = (start.replace(tzinfo=None), end.replace(tzinfo=None))
+            else:
+                bounds = (start, end)
+            duration = timeit.timeit(
+                lambda: list(PERIODS[period](context)(*bounds)),
+                number=NUMBER)
+            print('{:<22} {:<10} {:8.2f} ms per expansion'.format(
+                period, name, duration / NUMBER * 1e3))
+
+
+if __name__ == '__main__':
+    main()
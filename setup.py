@@ -31,8 +31,8 @@ setuptools.setup(
         'License :: OSI Approved :: MIT License',
         'Natural Language :: English',
         'Operating System :: OS Independent',
-        'Programming Language :: Python :: 2.7',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: Implementation :: CPython',
@@ -43,6 +43,7 @@ setuptools.setup(
     namespace_packages=['icemac'],
     include_package_data=True,
     zip_safe=False,
+    python_requires='>=3.7',
     install_requires=[
         'gocept.month >= 2',
         'grokcore.component >= 2.6',
@@ -54,7 +55,14 @@ setuptools.setup(
         'zope.interface',
     ],
     extras_require=dict(
+        numpy=[
+            'numpy',
+        ],
         test=[
+            'numpy',
+            'pytz',
             'zope.configuration',
+            'zope.i18n',
+            'zope.publisher',
         ]),
 )
@@ -1 +1,23 @@
-from .recurrence import get_recurrences, get_recurring  # noqa
+# The functions using the Zope Component Architecture are imported lazily, so
+# `icemac.recurrence.core` can be used without importing it.
+_RECURRENCE_NAMES = frozenset([
+    'get_recurrences',
+    'get_recurrences_bulk',
+    'get_recurrences_merged',
+    'get_recurring',
+])
+
+
+def __getattr__(name):
+    if name in _RECURRENCE_NAMES:
+        from . import recurrence
+        value = getattr(recurrence, name)
+        # Store it, so further accesses do not call this function:
+        globals()[name] = value
+        return value
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | _RECURRENCE_NAMES)
@@ -0,0 +1,71 @@
+"""Compute recurrences without blocking the asyncio event loop.
+
+The recurrences are computed in chunks. The event loop runs other tasks
+between the chunks, or the chunks are computed in an executor.
+"""
+from .recurrence import _lookup_factory
+import asyncio
+import itertools
+import zope.component
+
+
+def _expand(events, interval_start, interval_end, site_manager):
+    """Compute the (key, recurrence) tuples of the events."""
+    for key, datetime, period in events:
+        adapter = _lookup_factory(datetime, period, site_manager)(datetime)
+        for recurrence in adapter(interval_start, interval_end):
+            yield key, recurrence
+
+
+def _take(iterator, chunksize):
+    """Get a list of the next `chunksize` items of `iterator`."""
+    return list(itertools.islice(iterator, chunksize))
+
+
+async def iter_chunks(events, interval_start, interval_end, chunksize=1000,
+                      executor=None):
+    """Get the recurrences of many events within the interval in chunks.
+
+    events ... iterable of (key, datetime, period) tuples, `key` is an
+               arbitrary value identifying the event
+    interval_start ... date, part of the interval
+    interval_end ... date, _not_ part of the interval
+    chunksize ... maximum number of recurrences in a chunk
+    executor ... `concurrent.futures.ThreadPoolExecutor` computing the
+                 chunks, if it is `None` they are computed in the event loop
+
+    Returns an asynchronous iterator of lists of (key, datetime) tuples in
+    the order of `events`. The adapters are looked up in the site manager
+    which is current when the iteration starts, even if they are computed
+    in an executor.
+
+    """
+    loop = asyncio.get_running_loop()
+    iterator = _expand(events, interval_start, interval_end,
+                       zope.component.getSiteManager())
+    while True:
+        if executor is None:
+            chunk = _take(iterator, chunksize)
+        else:
+            chunk = await loop.run_in_executor(
+                executor, _take, iterator, chunksize)
+        if not chunk:
+            break
+        yield chunk
+        if executor is None:
+            # Let the event loop run other tasks before the next chunk:
+            await asyncio.sleep(0)
+
+
+async def iter_recurrences(events, interval_start, interval_end,
+                           chunksize=1000, executor=None):
+    """Get the recurrences of many events within the interval.
+
+    Returns an asynchronous iterator of (key, datetime) tuples, see
+    `iter_chunks()` for the arguments.
+
+    """
+    async for chunk in iter_chunks(
+            events, interval_start, interval_end, chunksize, executor):
+        for item in chunk:
+            yield item
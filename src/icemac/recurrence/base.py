@@ -1,77 +1,55 @@
+from . import core
+from .core import ONE_DAY  # noqa
+from .core import next_date_of_same_weekday, _get_isoweekday_difference  # noqa
 from .interfaces import IRecurringDateTime
-from datetime import timedelta, datetime
 import grokcore.component as grok
+import zope.globalrequest
 import zope.interface.common.idatetime
 
 
-ONE_DAY = timedelta(days=1)
+def _get_request_locale():
+    """Get the locale of the current request, `None` if there is none."""
+    request = zope.globalrequest.getRequest()
+    if request is None:
+        return None
+    return request.locale
 
 
-def _get_isoweekday_difference(date1, date2):
-    """Difference of isoweekdays between days."""
-    days = 7 - (date1.isoweekday() - date2.isoweekday())
-    if days >= 7:
-        days -= 7
-    return days
-
-
-def next_date_of_same_weekday(wd_src, base_date, additional_weeks=0):
-    """Compute next day with the same weekday as `wd_src` from `base_date` on.
-
-    If `additional_weeks` is not zero, its number of weeks are added
-    afterwards.
-    If `wd_src` and `base_date` have the same weekday `base_date` is returned.
+class RecurringDateTime(core.RecurringDateTime, grok.Adapter):
+    """Base class for recurring datestimes.
 
+    Computing the recurrences does not depend on the current request. Only
+    `info` uses its locale, call `get_info()` to pass the locale explicitly.
     """
-    add_days = _get_isoweekday_difference(base_date, wd_src)
-    return base_date + (add_days + additional_weeks * 7) * ONE_DAY
-
-
-class RecurringDateTime(grok.Adapter):
-    """Base class for recurring datestimes."""
 
     grok.context(zope.interface.common.idatetime.IDateTime)
     grok.implements(IRecurringDateTime)
     grok.baseclass()
 
-    def __call__(self, interval_start, interval_end):
-        self.interval_start = interval_start
-        self.interval_end = interval_end
-        return self.compute()
+    @property
+    def info(self):
+        return self.get_info(_get_request_locale())
 
-    def compute(self):
+    def get_info(self, locale=None):
         raise NotImplementedError('Implement in subclass!')
 
-    @property
-    def _weekday(self):
-        request = zope.globalrequest.getRequest()
+    def _get_weekday(self, locale):
+        """Get the name of the weekday of the context in `locale`.
+
+        Returns the isoweekday if `locale` is `None`.
+        """
         weekday = self.context.isoweekday()
-        if request is not None:
-            calendar = request.locale.dates.calendars['gregorian']
+        if locale is not None:
+            calendar = locale.dates.calendars['gregorian']
             return calendar.getDayNames()[weekday - 1]
         return weekday
 
+    @property
+    def _weekday(self):
+        return self._get_weekday(_get_request_locale())
+
 
-class StaticIntervalBase(RecurringDateTime):
+class StaticIntervalBase(core.StaticIntervalBase, RecurringDateTime):
     """Base class for recurrences of a fix interval e. g. 1 day or 1 week."""
 
     grok.baseclass()
-    interval = NotImplemented
-
-    def _get_start_date(self):
-        raise NotImplementedError('Implement in subclass!')
-
-    def combine_with_time_of_context(self, date):
-        """Combine the date with the time of the context."""
-        time = self.context.time()
-        tz = self.context.tzinfo
-        return tz.localize(datetime.combine(date, time))
-
-    def compute(self):
-        if self.interval_start <= self.context:
-            current_date = self.context
-        else:
-            current_date = self._get_start_date()
-        while current_date < self.interval_end:
-            yield self.combine_with_time_of_context(current_date)
-            current_date += self.interval
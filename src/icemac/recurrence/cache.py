@@ -0,0 +1,121 @@
+"""Cache of computed recurrences.
+
+The cache is opt-in: create a `RecurrenceCache` and call its
+`get_recurrences()` instead of `icemac.recurrence.get_recurrences()`. It
+returns the same recurrences.
+"""
+from .core import get_localizer
+from .recurrence import get_recurring
+from datetime import datetime, timedelta
+import bisect
+import collections
+
+
+# The recurrences are computed for a few more days around the months. So
+# they are complete even if the time zone of a recurrence differs from the
+# one of the interval:
+MARGIN = timedelta(days=2)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def _first_of_month(instant, months=0):
+    """Get the beginning of the month of `instant` plus `months`.
+
+    It is localized in the time zone of `instant`, so it has the offset to
+    UTC valid at this time.
+    """
+    year, month = divmod(instant.year * 12 + instant.month - 1 + months, 12)
+    return get_localizer(instant.tzinfo)(datetime(year, month + 1, 1))
+
+
+def _month_bounds(interval_start, interval_end):
+    """Get the months containing the interval.
+
+    Returns the beginning of the month of `interval_start` and the beginning
+    of the month after the one of the last instant before `interval_end`
+    each in their time zone.
+    """
+    return (_first_of_month(interval_start),
+            _first_of_month(interval_end - MICROSECOND, 1))
+
+
+class RecurrenceCache(object):
+    """Least recently used cache of computed recurrences.
+
+    maxsize ... maximum number of cached expansions, at least 1
+
+    The recurrences are cached per month: The recurrences of the whole months
+    containing the interval get computed, so the recurrences of other
+    intervals within these months are taken from the cache.
+    """
+
+    def __init__(self, maxsize=128):
+        if maxsize < 1:
+            raise ValueError(
+                'maxsize must be at least 1, got {}.'.format(maxsize))
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _expand(self, key):
+        """Get the recurrences of the months stored under `key`.
+
+        Returns the recurring adapter and the recurrences.
+        """
+        try:
+            result = self._data.pop(key)
+        except KeyError:
+            self.misses += 1
+            dt, tzinfo, period, start, end = key
+            recurring = get_recurring(dt, period)
+            # The periods with a fix interval start at the date of the
+            # interval start in its time zone, so the first recurrence might
+            # be up to `MARGIN` before it. The expansion needs this margin for
+            # its own start and the intervals within the months:
+            result = (recurring, tuple(
+                recurring(start - 2 * MARGIN, end + 2 * MARGIN)))
+            if len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+        else:
+            self.hits += 1
+        # (Re-)insert the entry as the most recently used one:
+        self._data[key] = result
+        return result
+
+    def get_recurrences(self, datetime, period, interval_start, interval_end):
+        """Get the recurrences of `period` within the interval.
+
+        period ... string, name of an adapter, see
+                   `icemac.recurrence.get_recurrences()`
+        interval_start ... datetime, part of the interval
+        interval_end ... datetime, _not_ part of the interval
+
+        Returns a tuple of the same recurrences as
+        `icemac.recurrence.get_recurrences()`.
+
+        """
+        # Datetimes at the same instant are equal even if their time zones
+        # differ, but the time zone defines the recurrences:
+        key = (datetime, datetime.tzinfo, period) + _month_bounds(
+            interval_start, interval_end)
+        recurring, recurrences = self._expand(key)
+        # The recurrences of the interval are defined by the rules of the
+        # period, e. g. the periods with a fix interval start at the date of
+        # `interval_start`. So slice them using the first recurrence and the
+        # number of recurrences the period computes:
+        count = recurring.count(interval_start, interval_end)
+        if not count:
+            return ()
+        first = next(iter(recurring(interval_start, interval_end)))
+        begin = bisect.bisect_left(recurrences, first)
+        return recurrences[begin:begin + count]
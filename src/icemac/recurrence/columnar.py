@@ -0,0 +1,189 @@
+"""Recurrences as arrays of integers.
+
+A datetime object per recurrence needs a lot of memory and is expensive to
+send to an other process. `EpochSequence` and `EpochRecurrences` store the
+recurrences as microseconds since the epoch and create the datetimes only
+on access.
+"""
+from . import core
+from .recurrence import _lookup_factory
+from array import array
+import datetime
+
+
+EPOCH = datetime.datetime(1970, 1, 1)
+UTC = datetime.timezone.utc
+EPOCH_UTC = EPOCH.replace(tzinfo=UTC)
+MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def to_epoch(value):
+    """Convert a datetime to microseconds since the epoch.
+
+    Aware datetimes are converted to UTC, naive ones are taken as they are.
+    """
+    if value.tzinfo is None:
+        return (value - EPOCH) // MICROSECOND
+    return (value - EPOCH_UTC) // MICROSECOND
+
+
+def from_epoch(value, tzinfo):
+    """Convert microseconds since the epoch to a datetime in `tzinfo`.
+
+    The datetime is naive if `tzinfo` is `None`. A datetime converted by
+    `to_epoch()` is restored at the same instant. If its local time did not
+    exist, the result is normalized: e. g. 3:00 instead of 2:00 at the start
+    of DST in Europe.
+    """
+    result = EPOCH + datetime.timedelta(microseconds=value)
+    if tzinfo is None:
+        return result
+    return result.replace(tzinfo=UTC).astimezone(tzinfo)
+
+
+class EpochSequence(object):
+    """Recurrences of an event.
+
+    instants ... array, microseconds since the epoch of the recurrences
+    tzinfo ... time zone of the event, it is shared by the recurrences
+
+    The datetimes are created on access.
+
+    """
+
+    def __init__(self, instants, tzinfo):
+        self.instants = instants
+        self.tzinfo = tzinfo
+
+    def __len__(self):
+        return len(self.instants)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return EpochSequence(self.instants[index], self.tzinfo)
+        return from_epoch(self.instants[index], self.tzinfo)
+
+    def __iter__(self):
+        tzinfo = self.tzinfo
+        for instant in self.instants:
+            yield from_epoch(instant, tzinfo)
+
+
+class EpochRecurrences(object):
+    """Recurrences of many events.
+
+    counts ... array, number of recurrences of each event
+    instants ... array, microseconds since the epoch of the recurrences of
+                 all events ordered by the event
+    tzinfos ... list, time zone of each event
+    keys ... list, key of each event, defaults to the number of the event
+
+    """
+
+    def __init__(self, counts, instants, tzinfos, keys=None):
+        self.counts = counts
+        self.instants = instants
+        self.tzinfos = tzinfos
+        if keys is None:
+            keys = range(len(counts))
+        self.keys = keys
+        self._starts = None
+
+    def __len__(self):
+        return len(self.instants)
+
+    def _get_start(self, number):
+        """Get the position of the first recurrence of event `number`."""
+        if self._starts is None:
+            starts = array('q', [0])
+            for count in self.counts:
+                starts.append(starts[-1] + count)
+            self._starts = starts
+        return self._starts[number]
+
+    def recurrences(self, number):
+        """Get the recurrences of event `number` as `EpochSequence`."""
+        start = self._get_start(number)
+        return EpochSequence(
+            self.instants[start:start + self.counts[number]],
+            self.tzinfos[number])
+
+    def datetimes(self, number):
+        """Get the recurrences of event `number` as list of datetimes."""
+        return list(self.recurrences(number))
+
+    def __iter__(self):
+        """Iterate over the (key of the event, datetime) tuples."""
+        instants = iter(self.instants)
+        for key, count, tzinfo in zip(self.keys, self.counts, self.tzinfos):
+            for i in range(count):
+                yield key, from_epoch(next(instants), tzinfo)
+
+
+def _collect(recurrings, interval_start, interval_end):
+    """Compute the recurrences of the recurring instances as arrays.
+
+    Returns the number of recurrences of each instance and the recurrences.
+    """
+    counts = array('q')
+    instants = array('q')
+    for recurring in recurrings:
+        # The recurrences are naive if the context is naive, see
+        # `to_epoch()`:
+        if recurring.context.tzinfo is None:
+            epoch = EPOCH
+        else:
+            epoch = EPOCH_UTC
+        before = len(instants)
+        instants.extend([(x - epoch) // MICROSECOND
+                         for x in recurring(interval_start, interval_end)])
+        counts.append(len(instants) - before)
+    return counts, instants
+
+
+def expand(events, interval_start, interval_end):
+    """Compute the recurrences of many events within the interval.
+
+    events ... iterable of (datetime, period) tuples, see
+               `icemac.recurrence.core.PERIODS` for the names of the periods
+    interval_start ... date, part of the interval
+    interval_end ... date, _not_ part of the interval
+
+    The recurrences are computed without the ZCA. Returns an
+    `EpochRecurrences` instance.
+
+    """
+    events = list(events)
+    counts, instants = _collect(
+        (core.PERIODS[period](dt) for dt, period in events),
+        interval_start, interval_end)
+    return EpochRecurrences(counts, instants, [dt.tzinfo for dt, _ in events])
+
+
+def get_recurrences(datetime, period, interval_start, interval_end):
+    """Get the recurrences of `period` within the interval.
+
+    It is the same as `icemac.recurrence.get_recurrences()` but returns an
+    `EpochSequence`.
+
+    """
+    recurring = _lookup_factory(datetime, period)(datetime)
+    counts, instants = _collect([recurring], interval_start, interval_end)
+    return EpochSequence(instants, datetime.tzinfo)
+
+
+def get_recurrences_bulk(events, interval_start, interval_end):
+    """Get the recurrences of many events within the interval.
+
+    It is the same as `icemac.recurrence.get_recurrences_bulk()` but returns
+    an `EpochRecurrences` instance. Iterating over it returns the
+    (key, datetime) tuples in the order of `events`.
+
+    """
+    events = list(events)
+    counts, instants = _collect(
+        (_lookup_factory(dt, period)(dt) for _, dt, period in events),
+        interval_start, interval_end)
+    return EpochRecurrences(
+        counts, instants, [dt.tzinfo for _, dt, _ in events],
+        [key for key, _, _ in events])
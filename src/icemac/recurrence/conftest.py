@@ -2,6 +2,7 @@ import datetime
 import icemac.recurrence
 import pytest
 import pytz
+import random
 import zope.configuration.xmlconfig
 import zope.globalrequest
 import zope.i18n
@@ -45,6 +46,34 @@ class DateTimeClass:
         return tzinfo.localize(datetime.datetime(*args))
 
 
+@pytest.fixture(scope='session')
+def random_intervals(DateTime):
+    """List of random (datetime, interval_start, interval_end) tuples.
+
+    They are in different time zones, some of them having DST. The list is the
+    same for each test run.
+    """
+    rand = random.Random(4711)
+    zones = [pytz.utc] + [pytz.timezone(x) for x in (
+        'Europe/Berlin', 'America/New_York', 'Australia/Lord_Howe')]
+
+    def random_datetime():
+        # The hours between 0 and 3 are ambiguous or do not exist at DST
+        # changes in these time zones:
+        return DateTime(
+            rand.randint(2010, 2020), rand.randint(1, 12), rand.randint(1, 28),
+            rand.choice([0, 1, 2, 3, 12, 23]), rand.choice([0, 30, 59]),
+            tzinfo=rand.choice(zones))
+
+    result = []
+    for i in range(200):
+        start = random_datetime()
+        end = start + datetime.timedelta(
+            days=rand.randint(0, 800), hours=rand.randint(-3, 3))
+        result.append((random_datetime(), start, end))
+    return result
+
+
 @pytest.fixture('session')
 def info():
     """Call `info` on a recurrence adapter and translate the result."""
@@ -0,0 +1,889 @@
+"""Computation of recurrences in plain Python.
+
+This module neither needs the Zope Component Architecture nor ZCML, so it
+can be used in processes which need a fast startup. The adapters registered
+via ZCML are thin wrappers around the classes defined here.
+"""
+from array import array
+from datetime import timedelta, datetime, date as Date
+import bisect
+import calendar
+
+
+ZERO = timedelta(0)
+ONE_DAY = timedelta(days=1)
+TWO_DAYS = timedelta(days=2)
+ONE_WEEK = timedelta(days=7)
+TWO_WEEKS = timedelta(days=14)
+# The weekdays of the Gregorian calendar repeat after 400 years:
+CYCLE_MONTHS = 400 * 12
+# The month index of the start of a cycle:
+CYCLE_START = 2000 * 12
+# The `icemac.recurrence.stats.Stats` instance recording the computations of
+# the recurrences, `None` if they are not recorded:
+_stats = None
+
+
+def _get_isoweekday_difference(date1, date2):
+    """Difference of isoweekdays between days."""
+    days = 7 - (date1.isoweekday() - date2.isoweekday())
+    if days >= 7:
+        days -= 7
+    return days
+
+
+def next_date_of_same_weekday(wd_src, base_date, additional_weeks=0):
+    """Compute next day with the same weekday as `wd_src` from `base_date` on.
+
+    If `additional_weeks` is not zero, its number of weeks are added
+    afterwards.
+    If `wd_src` and `base_date` have the same weekday `base_date` is returned.
+
+    """
+    add_days = _get_isoweekday_difference(base_date, wd_src)
+    return base_date + (add_days + additional_weeks * 7) * ONE_DAY
+
+
+def add_years(date, years):
+    """Add `years` number of years to date."""
+    try:
+        return date.replace(year=date.year + years)
+    except ValueError:
+        # Handle 29th of February as 28th in non-leap years:
+        return date.replace(year=date.year + years, day=date.day - 1)
+
+
+def microseconds(delta):
+    """Return the `datetime.timedelta` `delta` as number of microseconds."""
+    return (delta.days * 86400 + delta.seconds) * 10 ** 6 + delta.microseconds
+
+
+def month_index(date):
+    """Return the number of months since the beginning of the era."""
+    return date.year * 12 + date.month - 1
+
+
+def first_of_month(index):
+    """Return the first day of the month with the month index `index`."""
+    year, month = divmod(index, 12)
+    return datetime(year, month + 1, 1).date()
+
+
+class MonthTable(object):
+    """Table of the isoweekday of the first day and the length of months.
+
+    first_year, last_year ... years covered by the table, the months outside
+                              of them are computed on each call
+
+    The table is built on its first use.
+    """
+
+    def __init__(self, first_year, last_year):
+        self.first_month = first_year * 12
+        self.years = range(first_year, last_year + 1)
+        self.weekdays = None
+        self.lengths = None
+
+    def _build(self):
+        weekdays = array('B')
+        lengths = array('B')
+        for year in self.years:
+            for month in range(1, 13):
+                weekday, length = calendar.monthrange(year, month)
+                weekdays.append(weekday + 1)
+                lengths.append(length)
+        self.weekdays, self.lengths = weekdays, lengths
+
+    def __call__(self, month):
+        """Get isoweekday and length of the month with month index `month`."""
+        if self.lengths is None:
+            self._build()
+        index = month - self.first_month
+        if 0 <= index < len(self.lengths):
+            return self.weekdays[index], self.lengths[index]
+        year, month = divmod(month, 12)
+        weekday, length = calendar.monthrange(year, month + 1)
+        return weekday + 1, length
+
+
+# Replace it to use an other range of years:
+month_table = MonthTable(1900, 2199)
+
+
+def days_in_month(year, month):
+    """Return the number of days in `month` of `year`."""
+    return month_table(year * 12 + month - 1)[1]
+
+
+def recurrences_of_weekday_in_month(date, year, month):
+    """Return number of recurrences of weekday of `date` in `month`."""
+    weekday, length = month_table(year * 12 + month - 1)
+    minus_days = (date.isoweekday() - weekday) % 7
+    # Ceiling division of the remaining days by the length of a week:
+    return (length - minus_days + 6) // 7
+
+
+class Localizer(object):
+    """Localize naive datetimes the same way as `tz.localize()` of pytz.
+
+    `tz.localize()` has to look up the transitions of the time zone for each
+    datetime. The localizer remembers the range of local times around the
+    last result which have the same offset to UTC and are neither ambiguous
+    nor non-existent. The datetimes in this range get their tzinfo without
+    looking it up.
+    """
+
+    def __init__(self, tz):
+        self.tz = tz
+        self.transitions = getattr(tz, '_utc_transition_times', None)
+        if self.transitions is not None:
+            self.offsets = [x[0] for x in tz._transition_info]
+        # The range of the local times and their tzinfo. They are stored
+        # together, so concurrent calls always see a consistent state. The
+        # range is empty until the first result:
+        self.run = (datetime.max, datetime.max, None)
+
+    def __call__(self, wall):
+        lower, upper, tzinfo = self.run
+        if lower <= wall < upper:
+            return wall.replace(tzinfo=tzinfo)
+        result = self.tz.localize(wall)
+        self._remember(result)
+        return result
+
+    def _remember(self, result):
+        """Remember the range of the local times around `result`."""
+        if self.transitions is None:
+            # UTC or a time zone with a static offset:
+            self.run = (datetime.min, datetime.max, result.tzinfo)
+            return
+        transitions = self.transitions
+        offsets = self.offsets
+        utc = result.replace(tzinfo=None) - result.utcoffset()
+        index = max(0, bisect.bisect_right(transitions, utc) - 1)
+        if result.tzinfo is not self.tz._tzinfos[
+                self.tz._transition_info[index]]:
+            return  # `result` is non-existent, it is in a gap
+        if index == 0:
+            lower = datetime.min
+        else:
+            lower = transitions[index] + max(
+                offsets[index], offsets[index - 1])
+        if index + 1 == len(transitions):
+            upper = datetime.max
+        else:
+            if transitions[index + 1] - transitions[index] < 2 * ONE_DAY:
+                # `tz.localize()` only looks up the transitions one day
+                # before and after the local time, so it might miss this one:
+                return
+            upper = transitions[index + 1] + min(
+                offsets[index], offsets[index + 1])
+        self.run = (lower, upper, result.tzinfo)
+
+
+class FoldLocalizer(object):
+    """Localize naive datetimes in time zones implementing PEP 495.
+
+    Examples are `zoneinfo.ZoneInfo` or `datetime.timezone`. The results are
+    the same instants as the ones of `tz.localize()` of pytz: Ambiguous local
+    times get the offset without DST, if both have the same DST the later
+    one. Non-existent local times get the offset before the gap.
+    """
+
+    def __init__(self, tz):
+        self.tz = tz
+
+    def __call__(self, wall):
+        result = wall.replace(tzinfo=self.tz)
+        other = result.replace(fold=1)
+        if result.utcoffset() <= other.utcoffset():
+            return result  # unambiguous or non-existent
+        if not result.dst() and other.dst():
+            return result
+        return other
+
+
+def _keep_naive(wall):
+    """Localizer for naive datetimes."""
+    return wall
+
+
+# Cache of the localizers per time zone, see `get_localizer()`:
+_localizers = {}
+
+
+def get_localizer(tz):
+    """Get a callable localizing naive datetimes in the time zone `tz`.
+
+    tz ... pytz time zone, an other `tzinfo` implementing PEP 495 or `None`
+           for naive datetimes
+
+    The localizers are shared between all users of the same time zone.
+
+    """
+    if tz is None:
+        return _keep_naive
+    try:
+        return _localizers[tz]
+    except KeyError:
+        pass
+    if hasattr(tz, 'localize'):
+        localizer = Localizer(tz)
+    else:
+        localizer = FoldLocalizer(tz)
+    return _localizers.setdefault(tz, localizer)
+
+
+class RecurringDateTime(object):
+    """Base class for recurring datestimes.
+
+    The instances do not store any state besides their context, so they can
+    be called with different intervals, even concurrently.
+    """
+
+    __slots__ = ('context',)
+
+    def __init__(self, context):
+        self.context = context
+
+    @property
+    def _localize(self):
+        """Localize a naive datetime in the time zone of the context.
+
+        Override it to use an other localization strategy.
+        """
+        return get_localizer(self.context.tzinfo)
+
+    def _to_local(self, instant):
+        """Convert `instant` to the time zone of the context."""
+        if self.context.tzinfo is None:
+            return instant
+        return instant.astimezone(self.context.tzinfo)
+
+    def __call__(self, interval_start, interval_end):
+        if _stats is None:
+            return self.compute(interval_start, interval_end)
+        return _stats.record(self, self.compute(interval_start, interval_end))
+
+    def compute(self, interval_start, interval_end):
+        raise NotImplementedError('Implement in subclass!')
+
+    def count(self, interval_start, interval_end):
+        """Number of recurrences in the interval.
+
+        It is the same as the length of the result of `__call__()` but
+        without computing each recurrence.
+        """
+        return sum(1 for x in self.compute(interval_start, interval_end))
+
+    def reverse(self, interval_start, interval_end):
+        """Recurrences in the interval, the newest one first.
+
+        This default computes all recurrences of the interval before
+        returning the first one. The periods override it to compute them
+        lazily starting at `interval_end`.
+        """
+        return reversed(list(self.compute(interval_start, interval_end)))
+
+    def nth(self, index):
+        """Recurrence number `index`, the first one (`index=0`) is the context.
+        """
+        raise NotImplementedError('Implement in subclass!')
+
+    def next_after(self, instant):
+        """First recurrence after `instant`."""
+        raise NotImplementedError('Implement in subclass!')
+
+    def previous_before(self, instant):
+        """Last recurrence before `instant` or `None` if there is none."""
+        raise NotImplementedError('Implement in subclass!')
+
+    def _check_index(self, index):
+        if index < 0:
+            raise ValueError('index must not be negative, got {}.'.format(
+                index))
+
+    def occurs_on(self, date):
+        """Is there a recurrence on `date` in the time zone of the context?"""
+        raise NotImplementedError('Implement in subclass!')
+
+    def _recurrence_on(self, date):
+        """Get the recurrence on `date`, there has to be one on this date."""
+        return self._localize(datetime.combine(date, self.context.time()))
+
+    def __contains__(self, instant):
+        """Is `instant` a recurrence?"""
+        date = self._to_local(instant).date()
+        return self.occurs_on(date) and self._recurrence_on(date) == instant
+
+    def _bucket(self):
+        """Key of the bucket of the context in a `RecurrenceIndex`."""
+        raise NotImplementedError('Implement in subclass!')
+
+    @classmethod
+    def _buckets_on(cls, date):
+        """Keys of the buckets with recurrences on the local `date`."""
+        raise NotImplementedError('Implement in subclass!')
+
+
+class StaticIntervalBase(RecurringDateTime):
+    """Base class for recurrences of a fix interval e. g. 1 day or 1 week."""
+
+    __slots__ = ()
+    interval = NotImplemented
+
+    def _get_start_date(self, interval_start):
+        raise NotImplementedError('Implement in subclass!')
+
+    def combine_with_time_of_context(self, date):
+        """Combine the date with the time of the context."""
+        return self._localize(datetime.combine(date, self.context.time()))
+
+    def _get_first_date(self, interval_start):
+        """Get the date to start the computation with."""
+        if interval_start <= self.context:
+            return self.context
+        return self._get_start_date(interval_start)
+
+    def compute(self, interval_start, interval_end):
+        current_date = self._get_first_date(interval_start)
+        while current_date < interval_end:
+            yield self.combine_with_time_of_context(current_date)
+            current_date += self.interval
+
+    def count(self, interval_start, interval_end):
+        # The smallest `k` with `first + k * interval >= interval_end`:
+        return max(0, -(microseconds(self._get_first_date(interval_start) -
+                                     interval_end) //
+                        microseconds(self.interval)))
+
+    def nth(self, index):
+        self._check_index(index)
+        return self.combine_with_time_of_context(
+            self.context + index * self.interval)
+
+    def occurs_on(self, date):
+        days = (date - self.context.date()).days
+        return days >= 0 and days % self.interval.days == 0
+
+    def _bucket(self):
+        return self.context.toordinal() % self.interval.days
+
+    @classmethod
+    def _buckets_on(cls, date):
+        return [date.toordinal() % cls.interval.days]
+
+    def reverse(self, interval_start, interval_end):
+        # Walk backwards through the dates `compute()` steps through:
+        first_date = self._get_first_date(interval_start)
+        index = self.count(interval_start, interval_end) - 1
+        while index >= 0:
+            yield self.combine_with_time_of_context(
+                first_date + index * self.interval)
+            index -= 1
+
+    def _get_index_near(self, instant):
+        """Get the index of a recurrence on the date of `instant`.
+
+        The date is computed in the time zone of the context. If there is
+        no recurrence on this date, the index of the next one is returned.
+        """
+        date = self._to_local(instant).date()
+        days = (date - self.context.date()).days
+        return -(-days // self.interval.days)
+
+    def next_after(self, instant):
+        # Start two recurrences early as the offset to UTC of the recurrences
+        # and `instant` might differ:
+        index = max(0, self._get_index_near(instant) - 2)
+        while True:
+            result = self.nth(index)
+            if result > instant:
+                return result
+            index += 1
+
+    def previous_before(self, instant):
+        index = self._get_index_near(instant) + 1
+        while index >= 0:
+            result = self.nth(index)
+            if result < instant:
+                return result
+            index -= 1
+        return None
+
+
+class Daily(StaticIntervalBase):
+    """Recurring each day."""
+
+    __slots__ = ()
+    interval = ONE_DAY
+
+    def _get_start_date(self, interval_start):
+        return interval_start
+
+
+class SameWeekdayBase(StaticIntervalBase):
+    """Base class for recurrences on the same weekday."""
+
+    __slots__ = ()
+
+    def _get_start_date(self, interval_start):
+        return next_date_of_same_weekday(self.context, interval_start)
+
+
+class Weekly(SameWeekdayBase):
+    """Recurring weekly on the same weekday."""
+
+    __slots__ = ()
+    interval = ONE_WEEK
+
+
+class BiWeekly(SameWeekdayBase):
+    """Recurring biweekly on the same weekday."""
+
+    __slots__ = ()
+    interval = TWO_WEEKS
+
+    def _get_start_date(self, interval_start):
+        candiate = next_date_of_same_weekday(self.context, interval_start)
+        # We have to compare the naive datetimes as otherwise the DST
+        # difference might be computed into the difference of the two dates:
+        naive_candiate = self.combine_with_time_of_context(
+            candiate).replace(tzinfo=None)
+        naive_context = self.context.replace(tzinfo=None)
+        interval = (naive_candiate - naive_context).days
+        assert interval % 7 == 0, \
+            'Interval has {} days. This is {} weeks and {} days!'.format(
+                interval, interval / 7, interval % 7)
+        if interval % 14 != 0:
+            # odd number of weeks
+            candiate = next_date_of_same_weekday(
+                self.context, interval_start + ONE_WEEK)
+        return candiate
+
+
+class SameNthWeekdayInMonthBase(RecurringDateTime):
+    """Base class for recurrings on the same day nth weekday in month.
+
+    The months are computed as month indices, see `month_index()`.
+    """
+
+    __slots__ = ()
+    month_interval = NotImplemented
+    n = NotImplemented
+    # Cache of the months having a recurrence within a cycle for the
+    # recurrences which do not exist in each month, see
+    # `_get_cycle_months()`:
+    _cycle_months = {}
+
+    def _n_in_month(self, weekday, length):
+        """Get `n` for a month.
+
+        weekday ... isoweekday of the first day of the month
+        length ... number of days in the month
+
+        """
+        return self.n
+
+    @property
+    def _in_each_month(self):
+        """Does the weekday exist in each month?"""
+        raise NotImplementedError('Implement in subclass!')
+
+    def _get_first_month(self, interval_start):
+        """Get the index of the month to start the computation with."""
+        month = month_index(interval_start.date() - TWO_DAYS)
+        # Adjust the month to a multiple of self.month_interval:
+        return month + (month - month_index(self.context)) % (
+            self.month_interval)
+
+    def _get_date_in_month(self, month):
+        """Get the date of the recurrence in the month with index `month`.
+
+        Returns `None` if the month has no such date.
+        """
+        weekday, length = month_table(month)
+        day = ((self.context.isoweekday() - weekday) % 7 +
+               7 * self._n_in_month(weekday, length) + 1)
+        if not 1 <= day <= length:
+            return None  # date has swapped into an other month
+        year, month = divmod(month, 12)
+        return Date(year, month + 1, day)
+
+    def compute(self, interval_start, interval_end):
+        upper_days = interval_end - self.context
+        if upper_days < ZERO:
+            return  # no need to compute: there will be no results
+        lower_days = interval_start - self.context
+        if lower_days < ZERO:
+            lower, lower_days = self.context, ZERO
+        else:
+            lower = interval_start
+        # Only the recurrences between these distances to the context get
+        # localized. The recurrences have the same local time as the context,
+        # so their distances in local time are days. As the offsets to UTC of
+        # a time zone differ by less than two days, the recurrences outside
+        # are outside of the interval, too. The ones inside this margin but
+        # outside of the interval get localized and skipped:
+        lower_days -= TWO_DAYS
+        upper_days += TWO_DAYS
+        context_date = self.context.date()
+        context_month = month_index(self.context)
+        month = month_index(context_date + lower_days)
+        # Adjust the month to a multiple of self.month_interval:
+        month = max(context_month,
+                    month + (month - context_month) % self.month_interval)
+        time = self.context.time()
+        localize = self._localize
+        skipped = 0  # number of localized recurrences not in the interval
+        try:
+            while True:
+                date = self._get_date_in_month(month)
+                month += self.month_interval
+                if date is None:
+                    continue  # the month has no such weekday
+                days = date - context_date
+                if days > upper_days:
+                    break
+                if days < lower_days:
+                    continue
+                result = localize(datetime.combine(date, time))
+                if result < lower:
+                    skipped += 1
+                    continue
+                if result >= interval_end:
+                    skipped += 1
+                    break
+                yield result
+        finally:
+            if _stats is not None:
+                _stats.skip(self, skipped)
+
+    def count(self, interval_start, interval_end):
+        if self.context > interval_end:
+            return 0
+        lower = max(self.context, interval_start)
+        lower_month = month_index(lower)
+        end_month = month_index(interval_end)
+        time = self.context.time()
+        localize = self._localize
+        count = 0
+        # The recurrence in the month after the end of the interval might be
+        # before the end if the interval has another time zone:
+        for month in range(self._get_first_month(interval_start),
+                           end_month + 2, self.month_interval):
+            date = self._get_date_in_month(month)
+            if date is None:
+                continue
+            if lower_month + 2 <= month <= end_month - 2:
+                # The months around the bounds of the interval have to be
+                # compared exactly as the time zones might differ, the ones
+                # in between are in the interval anyway:
+                count += 1
+                continue
+            result = localize(datetime.combine(date, time))
+            if lower <= result < interval_end:
+                count += 1
+        return count
+
+    def _localize_month(self, month):
+        """Get the recurrence in the month with index `month` or `None`."""
+        date = self._get_date_in_month(month)
+        if date is None:
+            return None
+        return self._localize(datetime.combine(date, self.context.time()))
+
+    def occurs_on(self, date):
+        month = month_index(date)
+        context_month = month_index(self.context)
+        return (month >= context_month and
+                (month - context_month) % self.month_interval == 0 and
+                self._get_date_in_month(month) == date)
+
+    def _bucket(self):
+        return (month_index(self.context) % self.month_interval,
+                self.context.isoweekday(), self._nth_of_date(self.context))
+
+    @classmethod
+    def _buckets_on(cls, date):
+        return [(month_index(date) % cls.month_interval, date.isoweekday(),
+                 cls._nth_of_date(date))]
+
+    def reverse(self, interval_start, interval_end):
+        last = self.previous_before(interval_end)
+        if last is None:
+            return
+        context_month = month_index(self.context)
+        month = month_index(last)
+        while month >= context_month:
+            result = self._localize_month(month)
+            if result is not None:
+                if result < interval_start:
+                    break
+                yield result
+            month -= self.month_interval
+
+    def _get_cycle_months(self):
+        """Get the months having a recurrence within a cycle.
+
+        Returns an array of the differences to `CYCLE_START` of the month
+        indices. They are computed as if the recurrence started before the
+        cycle. The recurrences repeat after `CYCLE_MONTHS`.
+        """
+        context_month = month_index(self.context)
+        key = (self.__class__, context_month % self.month_interval,
+               self.context.isoweekday())
+        try:
+            return self._cycle_months[key]
+        except KeyError:
+            pass
+        first = CYCLE_START + (context_month - CYCLE_START) % (
+            self.month_interval)
+        months = array('H', (
+            month - CYCLE_START
+            for month in range(first, CYCLE_START + CYCLE_MONTHS,
+                               self.month_interval)
+            if self._get_date_in_month(month) is not None))
+        return self._cycle_months.setdefault(key, months)
+
+    def nth(self, index):
+        self._check_index(index)
+        month = month_index(self.context)
+        if self._in_each_month:
+            return self._localize_month(month + index * self.month_interval)
+        # Count the months with a recurrence in the table of a cycle
+        # starting at the month of the context:
+        months = self._get_cycle_months()
+        cycle, offset = divmod(month - CYCLE_START, CYCLE_MONTHS)
+        cycles, position = divmod(
+            bisect.bisect_left(months, offset) + index, len(months))
+        return self._localize_month(
+            CYCLE_START + (cycle + cycles) * CYCLE_MONTHS + months[position])
+
+    def _get_month_near(self, instant):
+        """Get the month index of `instant` in the time zone of the context.
+        """
+        return month_index(self._to_local(instant))
+
+    def next_after(self, instant):
+        context_month = month_index(self.context)
+        # Start one month early as the offset to UTC of the recurrences and
+        # `instant` might differ:
+        month = max(context_month, self._get_month_near(instant) - 1)
+        month += (context_month - month) % self.month_interval
+        while True:
+            result = self._localize_month(month)
+            if result is not None and result > instant:
+                return result
+            month += self.month_interval
+
+    def previous_before(self, instant):
+        context_month = month_index(self.context)
+        month = self._get_month_near(instant) + 1
+        month -= (month - context_month) % self.month_interval
+        while month >= context_month:
+            result = self._localize_month(month)
+            if result is not None and result < instant:
+                return result
+            month -= self.month_interval
+        return None
+
+
+class SameNthWeekdayFromBeginningInMonthBase(SameNthWeekdayInMonthBase):
+    """Base class
+
+    For recurrings on the same day nth weekday in month counting from the
+    beginning of the month.
+    """
+
+    __slots__ = ('n',)
+
+    def __init__(self, context):
+        super(SameNthWeekdayFromBeginningInMonthBase, self).__init__(context)
+        self.n = self._nth_of_date(context)
+
+    @staticmethod
+    def _nth_of_date(date):
+        return (date.day - 1) // 7
+
+    @property
+    def _in_each_month(self):
+        # Each month has at least 28 days so only the 5th weekday is missing:
+        return self.n < 4
+
+
+class MonthlyNthWeekday(SameNthWeekdayFromBeginningInMonthBase):
+    """Recurring monthly on same recurrence of the weekday in the month as ...
+
+    ... in `self.context`.
+    """
+
+    __slots__ = ()
+    month_interval = 1
+
+
+class BiMonthlyNthWeekday(SameNthWeekdayFromBeginningInMonthBase):
+    """Recurring monthly on same recurrence of the weekday in the month as ...
+
+    ... in `self.context` but only every other month.
+    """
+
+    __slots__ = ()
+    month_interval = 2
+
+
+class SameNthWeekdayFromEndInMonthBase(SameNthWeekdayInMonthBase):
+    """Base class for recurrings on the same day nth weekday in month ...
+
+    ... counting from the end of the month.
+    """
+
+    __slots__ = ('n_from_end',)
+
+    def __init__(self, context):
+        super(SameNthWeekdayFromEndInMonthBase, self).__init__(context)
+        self.n_from_end = self._nth_of_date(context)
+
+    @staticmethod
+    def _nth_of_date(date):
+        last_day = days_in_month(date.year, date.month)
+        return (last_day - date.day) // 7 + 1
+
+    @property
+    def _in_each_month(self):
+        return self.n_from_end < 5
+
+    def _n_in_month(self, weekday, length):
+        minus_days = (self.context.isoweekday() - weekday) % 7
+        # Number of recurrences of the weekday minus the ones after it:
+        return (length - minus_days + 6) // 7 - self.n_from_end
+
+
+class MonthlyNthWeekdayFromEnd(SameNthWeekdayFromEndInMonthBase):
+    """Recurring monthly on same recurrence of the weekday in the month as ...
+
+    ... in `self.context`.
+    """
+
+    __slots__ = ()
+    month_interval = 1
+
+
+class BiMonthlyNthWeekdayFromEnd(SameNthWeekdayFromEndInMonthBase):
+    """Recurring monthly on same recurrence of the weekday in the month as ...
+
+    ... in `self.context` but only each other month.
+    """
+
+    __slots__ = ()
+    month_interval = 2
+
+
+class Yearly(RecurringDateTime):
+    """Recurring on the same date each year."""
+
+    __slots__ = ()
+
+    def _estimate_first_index(self, instant):
+        """Estimate the index of the first recurrence not before `instant`.
+
+        The estimate is at most two recurrences too small.
+        """
+        # Compute the index from the difference of the years. We start one
+        # year early as the time zones of `context` and `instant` might
+        # differ:
+        return max(0, instant.year - self.context.year - 1)
+
+    def _get_first_index(self, instant):
+        """Get the index of the first recurrence not before `instant`."""
+        index = self._estimate_first_index(instant)
+        while add_years(self.context, index) < instant:
+            index += 1
+        return index
+
+    def compute(self, interval_start, interval_end):
+        if self.context > interval_end:
+            return  # no need to compute: there will be no results
+        index = self._get_first_index(interval_start)
+        if _stats is not None:
+            # The years stepped through to find the first recurrence:
+            _stats.skip(
+                self, index - self._estimate_first_index(interval_start))
+        date = add_years(self.context, index)
+        # Yield dates in the interval:
+        while date < interval_end:
+            yield date
+            index += 1
+            date = add_years(self.context, index)
+
+    def count(self, interval_start, interval_end):
+        return max(0, self._get_first_index(interval_end) -
+                   self._get_first_index(interval_start))
+
+    def reverse(self, interval_start, interval_end):
+        index = self._get_first_index(interval_end) - 1
+        while index >= 0:
+            result = self.nth(index)
+            if result < interval_start:
+                break
+            yield result
+            index -= 1
+
+    def nth(self, index):
+        self._check_index(index)
+        return add_years(self.context, index)
+
+    def occurs_on(self, date):
+        years = date.year - self.context.year
+        return years >= 0 and add_years(self.context.date(), years) == date
+
+    def _recurrence_on(self, date):
+        return add_years(self.context, date.year - self.context.year)
+
+    def _bucket(self):
+        return (self.context.month, self.context.day)
+
+    @classmethod
+    def _buckets_on(cls, date):
+        result = [(date.month, date.day)]
+        if (date.month, date.day) == (2, 28) and not calendar.isleap(
+                date.year):
+            # The 29th of February recurs on the 28th in non-leap years:
+            result.append((2, 29))
+        return result
+
+    def next_after(self, instant):
+        index = self._get_first_index(instant)
+        result = self.nth(index)
+        if result == instant:
+            result = self.nth(index + 1)
+        return result
+
+    def previous_before(self, instant):
+        index = self._get_first_index(instant)
+        if index == 0:
+            return None
+        return self.nth(index - 1)
+
+
+# Mapping of the period names to the classes computing the recurrences:
+PERIODS = {
+    'daily': Daily,
+    'weekly': Weekly,
+    'biweekly': BiWeekly,
+    'nth weekday of month': MonthlyNthWeekday,
+    'nth weekday every other month': BiMonthlyNthWeekday,
+    'nth weekday from end of month': MonthlyNthWeekdayFromEnd,
+    'nth weekday from end of other month': BiMonthlyNthWeekdayFromEnd,
+    'yearly': Yearly,
+}
+
+
+def get_recurrences(datetime, period, interval_start, interval_end):
+    """Get an iterable of recurrences of `period` within the interval.
+
+    Works like `icemac.recurrence.get_recurrences()` but without the need to
+    load ZCML. Raises a `KeyError` if `period` is unknown.
+
+    """
+    return PERIODS[period](datetime)(interval_start, interval_end)
@@ -0,0 +1,113 @@
+"""Index of recurring events to query the ones recurring in an interval.
+
+The events are put into buckets by the class computing their recurrences
+and by a key the recurrences of the events in the bucket have in common,
+e. g. the weekday for `weekly` or the day of the year for `yearly`. A query
+only checks the events in the buckets with recurrences on the dates of the
+interval.
+"""
+from . import core
+from datetime import timedelta
+import collections
+
+
+# Each bucket has recurrences within each period of this number of days. (The
+# longest gap are 427 days between two recurrences of the 5th weekday from
+# the end in every other month.) So the dates of a longer interval do not
+# add further buckets:
+MAX_DAYS = 800
+
+
+def _utc_date(value):
+    """Get the date of the datetime `value` in UTC.
+
+    Naive datetimes are used as they are like in `icemac.recurrence.core`.
+    """
+    offset = value.utcoffset()
+    if offset is None:
+        return value.date()
+    return (value.replace(tzinfo=None) - offset).date()
+
+
+class RecurrenceIndex(object):
+    """Index of recurring events.
+
+    Events can be added and removed at any time.
+    """
+
+    def __init__(self):
+        # Mapping of (class, bucket key) to a mapping of the event key to the
+        # recurring instance:
+        self._buckets = collections.defaultdict(dict)
+        # Mapping of the event key to its (class, bucket key) tuple:
+        self._events = {}
+        # Number of events per class:
+        self._classes = collections.Counter()
+
+    def __len__(self):
+        return len(self._events)
+
+    def __contains__(self, key):
+        return key in self._events
+
+    def add(self, key, datetime, period):
+        """Add an event to the index.
+
+        key ... arbitrary hashable value identifying the event, an event
+                already having this key gets replaced
+        datetime ... the start of the recurrence
+        period ... name of the period, see `icemac.recurrence.core.PERIODS`
+
+        Raises a `KeyError` if the period is unknown.
+
+        """
+        recurring = core.PERIODS[period](datetime)
+        if key in self._events:
+            self.remove(key)
+        class_ = type(recurring)
+        bucket = (class_, recurring._bucket())
+        self._buckets[bucket][key] = recurring
+        self._events[key] = bucket
+        self._classes[class_] += 1
+
+    def remove(self, key):
+        """Remove the event with `key` from the index.
+
+        Raises a `KeyError` if there is no such event.
+
+        """
+        bucket = self._events.pop(key)
+        events = self._buckets[bucket]
+        del events[key]
+        if not events:
+            del self._buckets[bucket]
+        class_ = bucket[0]
+        self._classes[class_] -= 1
+        if not self._classes[class_]:
+            del self._classes[class_]
+
+    def query(self, interval_start, interval_end):
+        """Get the events with at least one recurrence in the interval.
+
+        interval_start ... date, part of the interval
+        interval_end ... date, _not_ part of the interval
+
+        Returns a list of the keys of the events.
+
+        """
+        # The local dates of the recurrences are at most one day off their
+        # date in UTC:
+        first = _utc_date(interval_start) - timedelta(days=1)
+        days = min(MAX_DAYS, (_utc_date(interval_end) - first).days + 2)
+        dates = [first + timedelta(days=x) for x in range(days)]
+        result = []
+        for class_ in self._classes:
+            keys = set()
+            for date in dates:
+                keys.update(class_._buckets_on(date))
+            for key in keys:
+                events = self._buckets.get((class_, key), {})
+                for event_key, recurring in events.items():
+                    if recurring.count(interval_start, interval_end):
+                        result.append(event_key)
+        return result
@@ -5,6 +5,9 @@ class IRecurringDateTime(zope.interface.Interface):
     """Recurring of a datetime.
 
     Period and base datetime are defined in class implementing the interface.
+
+    Computing the recurrences does not change the adapter, so it can be used
+    by many threads at once.
     """
 
     title = zope.interface.Attribute('Display title in RecurrencePeriodSource')
@@ -13,9 +16,70 @@ class IRecurringDateTime(zope.interface.Interface):
     info = zope.interface.Attribute(
         'Information about recurrence period e. g. `every sunday`.')
 
+    def get_info(locale=None):
+        """Information about recurrence period e. g. `every sunday`.
+
+        locale ... `zope.i18n.interfaces.locales.ILocale` used for the names
+                   of the weekdays, `info` uses the one of the current request
+
+        """
+
     def __call__(interval_start, interval_end):
         """Iterable of recurrences of base datetime in the interval.
 
         interval_start, interval_end ... `datetime.date` objects
 
         """
+
+    def count(interval_start, interval_end):
+        """Number of recurrences of base datetime in the interval.
+
+        interval_start, interval_end ... `datetime.date` objects
+
+        """
+
+    def reverse(interval_start, interval_end):
+        """Iterable of recurrences of base datetime in the interval.
+
+        interval_start, interval_end ... `datetime.date` objects
+
+        The recurrences are in reversed order: the newest one first.
+
+        """
+
+    def nth(index):
+        """Recurrence number `index` of base datetime.
+
+        index ... int, the first recurrence (base datetime) has the index 0
+
+        """
+
+    def next_after(instant):
+        """First recurrence of base datetime after `instant`.
+
+        instant ... `datetime.datetime` object
+
+        """
+
+    def previous_before(instant):
+        """Last recurrence of base datetime before `instant`.
+
+        instant ... `datetime.datetime` object
+
+        Returns `None` if there is no recurrence before `instant`.
+
+        """
+
+    def occurs_on(date):
+        """Is there a recurrence of base datetime on `date`?
+
+        date ... `datetime.date` object in the time zone of base datetime
+
+        """
+
+    def __contains__(instant):
+        """Is `instant` a recurrence of base datetime?
+
+        instant ... `datetime.datetime` object
+
+        """
@@ -0,0 +1,60 @@
+"""Compute the recurrences of many events in a pool of processes.
+
+The events are split into chunks which are computed by the worker processes
+using `icemac.recurrence.core`, so the workers do not need to load ZCML.
+They send back the recurrences as arrays of integers, see
+`icemac.recurrence.columnar`.
+"""
+from . import columnar
+from array import array
+import concurrent.futures
+import itertools
+
+
+def _expand_chunk(events, interval_start, interval_end):
+    """Compute the recurrences of a chunk of events in a worker."""
+    result = columnar.expand(events, interval_start, interval_end)
+    # The parent knows the time zones of the events:
+    return result.counts, result.instants
+
+
+def expand(events, interval_start, interval_end, max_workers=None,
+           chunksize=1000, executor=None):
+    """Compute the recurrences of many events in parallel.
+
+    events ... iterable of (datetime, period) tuples, see
+               `icemac.recurrence.core.PERIODS` for the names of the periods
+    interval_start ... date, part of the interval
+    interval_end ... date, _not_ part of the interval
+    max_workers ... number of worker processes, defaults to the number of
+                    CPUs
+    chunksize ... number of events computed by a worker at once
+    executor ... `concurrent.futures.Executor` to be used instead of a new
+                 pool of `max_workers` processes
+
+    Returns an `icemac.recurrence.columnar.EpochRecurrences` instance. The
+    recurrences are in the same order as if they were computed in a single
+    process.
+
+    """
+    events = list(events)
+    chunks = [events[x:x + chunksize]
+              for x in range(0, len(events), chunksize)]
+    counts = array('q')
+    instants = array('q')
+    if executor is None:
+        pool = executor = concurrent.futures.ProcessPoolExecutor(max_workers)
+    else:
+        pool = None
+    try:
+        # `map()` returns the results in the order of the chunks:
+        for chunk_counts, chunk_instants in executor.map(
+                _expand_chunk, chunks, itertools.repeat(interval_start),
+                itertools.repeat(interval_end)):
+            counts.extend(chunk_counts)
+            instants.extend(chunk_instants)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return columnar.EpochRecurrences(
+        counts, instants, [dt.tzinfo for dt, period in events])
@@ -1,10 +1,65 @@
 from .interfaces import IRecurringDateTime
+import heapq
+import weakref
 import zope.component
+import zope.interface
+
+
+# Cache of the adapter factories per adapter registry. Each entry is the
+# generation of the registry the entry was filled in and a dict mapping the
+# type of the datetime (or the specification it provides if it declares its
+# own interfaces) and the period name to the factory.
+# The registry increments its generation on each change, this invalidates
+# the entry, see `_lookup_factory()`:
+_factories = weakref.WeakKeyDictionary()
+
+
+def clear_cache():
+    """Clear the cache of the adapter factories.
+
+    The cache is invalidated when the registry changes, so it is only needed
+    to free its memory.
+    """
+    _factories.clear()
+
+
+def _lookup_factory(datetime, period, site_manager=None):
+    """Look up the factory of the recurring adapter named `period`.
+
+    The factory is looked up in `site_manager`, it defaults to the current
+    site manager.
+    """
+    if site_manager is None:
+        site_manager = zope.component.getSiteManager()
+    registry = site_manager.adapters
+    try:
+        generation, factories = _factories[registry]
+    except KeyError:
+        generation = None
+    if generation != registry._generation:
+        factories = {}
+        _factories[registry] = (registry._generation, factories)
+    if '__provides__' in getattr(datetime, '__dict__', ()):
+        # The instance provides interfaces besides the ones of its type:
+        key = (zope.interface.providedBy(datetime), period)
+    else:
+        key = (type(datetime), period)
+    try:
+        return factories[key]
+    except KeyError:
+        pass
+    factory = registry.lookup(
+        (zope.interface.providedBy(datetime),), IRecurringDateTime, period)
+    if factory is None:
+        raise zope.component.ComponentLookupError(
+            datetime, IRecurringDateTime, period)
+    factories[key] = factory
+    return factory
 
 
 def get_recurring(datetime, period):
     """Convenience function to get the recurring adapter named `period`."""
-    return zope.component.getAdapter(datetime, IRecurringDateTime, name=period)
+    return _lookup_factory(datetime, period)(datetime)
 
 
 def get_recurrences(datetime, period, interval_start, interval_end):
@@ -19,3 +74,51 @@ def get_recurrences(datetime, period, interval_start, interval_end):
 
     """
     return get_recurring(datetime, period)(interval_start, interval_end)
+
+
+def get_recurrences_bulk(events, interval_start, interval_end):
+    """Get the recurrences of many events within the interval.
+
+    events ... iterable of (key, datetime, period) tuples, `key` is an
+               arbitrary value identifying the event
+    interval_start ... date, part of the interval
+    interval_end ... date, _not_ part of the interval
+
+    Returns an iterable of (key, datetime) tuples in the order of `events`.
+    The adapter factories are taken from the cache of `get_recurring()`.
+
+    """
+    for key, datetime, period in events:
+        adapter = _lookup_factory(datetime, period)(datetime)
+        for recurrence in adapter(interval_start, interval_end):
+            yield key, recurrence
+
+
+def _tag(recurrences, number, key):
+    """Tag the `recurrences` with the number and key of their event."""
+    for recurrence in recurrences:
+        yield recurrence, number, key
+
+
+def get_recurrences_merged(events, interval_start, interval_end):
+    """Get the recurrences of many events in chronological order.
+
+    events ... iterable of (key, datetime, period) tuples, `key` is an
+               arbitrary value identifying the event
+    interval_start ... date, part of the interval
+    interval_end ... date, _not_ part of the interval
+
+    Returns an iterable of (key, datetime) tuples sorted by the datetime,
+    recurrences at the same time are in the order of `events`. The
+    recurrences are merged lazily: getting the first `n` of them computes at
+    most `n` recurrences plus one per event, so use `itertools.islice()` to
+    get a page of recurrences starting at `interval_start`.
+
+    """
+    streams = []
+    for number, (key, datetime, period) in enumerate(events):
+        adapter = _lookup_factory(datetime, period)(datetime)
+        streams.append(
+            _tag(adapter(interval_start, interval_end), number, key))
+    for recurrence, number, key in heapq.merge(*streams):
+        yield key, recurrence
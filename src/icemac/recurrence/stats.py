@@ -0,0 +1,124 @@
+"""Record statistics about the computation of the recurrences.
+
+The statistics are recorded while a `Stats` instance is active. Otherwise
+the computation only checks whether there is an active one.
+"""
+from . import core
+import threading
+import time
+
+
+class PeriodStats(object):
+    """Statistics of a period.
+
+    calls ... number of calls of the recurrence adapters
+    recurrences ... number of the computed recurrences
+    skipped ... number of computed recurrences which are not in the
+                interval, e. g. the years stepped through to find the first
+                yearly recurrence
+    seconds ... wall time spent computing the recurrences
+
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.recurrences = 0
+        self.skipped = 0
+        self.seconds = 0.0
+
+    def __repr__(self):
+        return ('<PeriodStats calls={0.calls} recurrences={0.recurrences} '
+                'skipped={0.skipped} seconds={0.seconds:.6f}>'.format(self))
+
+
+class Stats(object):
+    """Statistics of the computation of the recurrences per period.
+
+    Use it as context manager or call `start()` and `stop()`. Only one
+    instance is active at a time, it records the computations in all
+    threads. `periods` maps the names of the periods to `PeriodStats`.
+
+    Only calling the adapters is recorded, their other methods like `count()`
+    are not.
+    """
+
+    def __init__(self):
+        self.periods = {}
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start recording, it replaces the active instance."""
+        core._stats = self
+
+    def stop(self):
+        """Stop recording."""
+        if core._stats is self:
+            core._stats = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _get(self, recurring):
+        """Get the `PeriodStats` of the recurring instance."""
+        name = _get_period_name(type(recurring))
+        try:
+            return self.periods[name]
+        except KeyError:
+            return self.periods.setdefault(name, PeriodStats())
+
+    def record(self, recurring, recurrences):
+        """Record the computation of the `recurrences` of `recurring`.
+
+        Returns an iterator of the recurrences.
+        """
+        stats = self._get(recurring)
+        with self._lock:
+            stats.calls += 1
+        return self._measure(stats, recurrences)
+
+    def _measure(self, stats, recurrences):
+        clock = time.perf_counter
+        iterator = iter(recurrences)
+        while True:
+            begin = clock()
+            try:
+                recurrence = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                seconds = clock() - begin
+                with self._lock:
+                    stats.seconds += seconds
+            with self._lock:
+                stats.recurrences += 1
+            yield recurrence
+
+    def skip(self, recurring, number):
+        """Record `number` skipped loop iterations of `recurring`."""
+        stats = self._get(recurring)
+        with self._lock:
+            stats.skipped += number
+
+
+# Cache of the period names per class, see `_get_period_name()`:
+_period_names = {}
+
+
+def _get_period_name(class_):
+    """Get the name of the period computed by `class_`.
+
+    `class_` might be an adapter derived from a class in `core.PERIODS`. It
+    is the name of the class if it is not derived from one of them.
+    """
+    try:
+        return _period_names[class_]
+    except KeyError:
+        pass
+    names = {y: x for x, y in core.PERIODS.items()}
+    name = next((names[x] for x in class_.__mro__ if x in names),
+                class_.__name__)
+    return _period_names.setdefault(class_, name)
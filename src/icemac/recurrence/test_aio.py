@@ -0,0 +1,64 @@
+from .aio import iter_chunks, iter_recurrences
+from .core import PERIODS
+from .recurrence import get_recurrences_bulk
+import asyncio
+import concurrent.futures
+import pytest
+
+
+@pytest.fixture(scope='module')
+def events(random_intervals):
+    """Events of `random_intervals` in each period."""
+    return [((number, period), dt, period)
+            for number, (dt, _, _) in enumerate(random_intervals[:20])
+            for period in sorted(PERIODS)]
+
+
+async def collect(iterator):
+    """Collect the items of an asynchronous iterator."""
+    return [x async for x in iterator]
+
+
+def test_aio__iter_recurrences__1(random_intervals, events):
+    """It returns the same recurrences as `get_recurrences_bulk()`."""
+    start, end = random_intervals[0][1:]
+    expected = list(get_recurrences_bulk(events, start, end))
+    assert expected == asyncio.run(
+        collect(iter_recurrences(events, start, end, chunksize=10)))
+
+
+def test_aio__iter_chunks__1(random_intervals, events):
+    """It lets the event loop run other tasks between the chunks."""
+    start, end = random_intervals[0][1:]
+    log = []
+
+    async def tick():
+        while True:
+            log.append('tick')
+            await asyncio.sleep(0)
+
+    async def main():
+        ticker = asyncio.ensure_future(tick())
+        async for chunk in iter_chunks(events, start, end, chunksize=100):
+            assert len(chunk) <= 100
+            log.append('chunk')
+        ticker.cancel()
+
+    asyncio.run(main())
+    positions = [number for number, x in enumerate(log) if x == 'chunk']
+    assert len(positions) > 2
+    assert all('tick' == log[x + 1] for x in positions[:-1])
+
+
+def test_aio__iter_chunks__2(random_intervals, events):
+    """It can compute the chunks in an executor."""
+    start, end = random_intervals[1][1:]
+    expected = list(get_recurrences_bulk(events, start, end))
+
+    async def main(executor):
+        return [x async for chunk in iter_chunks(
+            events, start, end, chunksize=50, executor=executor)
+            for x in chunk]
+
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        assert expected == asyncio.run(main(executor))
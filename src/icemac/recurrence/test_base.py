@@ -38,7 +38,14 @@ def test_base__RecurringDateTime__compute__1():
     """It needs to be implemented by child classes."""
     instance = RecurringDateTime(None)
     with pytest.raises(NotImplementedError):
-        instance.compute()
+        instance.compute(None, None)
+
+
+def test_base__RecurringDateTime__get_info__1():
+    """It needs to be implemented by child classes."""
+    instance = RecurringDateTime(None)
+    with pytest.raises(NotImplementedError):
+        instance.get_info()
 
 
 def test_base__RecurringDateTime___weekday__1(DateTime):
@@ -51,4 +58,38 @@ def test_base__StaticIntervalBase___get_start_date__1():
     """It needs to be implemented by child classes."""
     instance = StaticIntervalBase(None)
     with pytest.raises(NotImplementedError):
-        instance._get_start_date()
+        instance._get_start_date(None)
+
+
+def test_base__RecurringDateTime__count__1():
+    """It counts the computed recurrences by default."""
+    class Recurring(RecurringDateTime):
+        def compute(self, interval_start, interval_end):
+            return iter(range(interval_start, interval_end))
+
+    assert 3 == Recurring(None).count(2, 5)
+
+
+@pytest.mark.parametrize('method, args', [
+    ('nth', (0,)), ('next_after', (None,)), ('previous_before', (None,))])
+def test_base__RecurringDateTime__nth__1(method, args):
+    """The random access methods need to be implemented by child classes."""
+    instance = RecurringDateTime(None)
+    with pytest.raises(NotImplementedError):
+        getattr(instance, method)(*args)
+
+
+def test_base__RecurringDateTime__occurs_on__1():
+    """It needs to be implemented by child classes."""
+    instance = RecurringDateTime(None)
+    with pytest.raises(NotImplementedError):
+        instance.occurs_on(None)
+
+
+def test_base__RecurringDateTime__reverse__1():
+    """It reverses the computed recurrences by default."""
+    class Recurring(RecurringDateTime):
+        def compute(self, interval_start, interval_end):
+            return iter(range(interval_start, interval_end))
+
+    assert [4, 3, 2] == list(Recurring(None).reverse(2, 5))
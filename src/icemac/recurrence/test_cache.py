@@ -0,0 +1,138 @@
+from .cache import RecurrenceCache
+from .core import PERIODS
+from .recurrence import get_recurrences
+import datetime
+import pytest
+import pytz
+
+
+DAY = datetime.timedelta(days=1)
+
+
+@pytest.fixture(scope='function')
+def cache():
+    """Empty cache."""
+    return RecurrenceCache(maxsize=2)
+
+
+@pytest.mark.parametrize('maxsize', [0, -1])
+def test_cache__RecurrenceCache____init____1(maxsize):
+    """It rejects a `maxsize` less than 1."""
+    with pytest.raises(ValueError) as err:
+        RecurrenceCache(maxsize)
+    assert 'maxsize must be at least 1, got {}.'.format(maxsize) == str(
+        err.value)
+
+
+def test_cache__RecurrenceCache__get_recurrences__1(DateTime, cache):
+    """It returns the recurrences in the interval as a tuple."""
+    dt = DateTime(2016, 2, 6, 10)
+    start = DateTime(2016, 3, 3)
+    end = DateTime(2016, 3, 27)
+    assert (tuple(get_recurrences(dt, 'weekly', start, end)) ==
+            cache.get_recurrences(dt, 'weekly', start, end))
+    assert (0, 1) == (cache.hits, cache.misses)
+
+
+def test_cache__RecurrenceCache__get_recurrences__2(DateTime, cache):
+    """It reuses the cached recurrences of the months of the interval."""
+    dt = DateTime(2016, 2, 6, 10)
+    assert ((DateTime(2016, 3, 5, 10),) ==
+            cache.get_recurrences(
+                dt, 'weekly', DateTime(2016, 3, 1), DateTime(2016, 3, 6)))
+    assert ((DateTime(2016, 3, 26, 10),) ==
+            cache.get_recurrences(
+                dt, 'weekly', DateTime(2016, 3, 20), DateTime(2016, 3, 27)))
+    assert (1, 1) == (cache.hits, cache.misses)
+    assert 1 == len(cache)
+
+
+def test_cache__RecurrenceCache__get_recurrences__3(
+        DateTime, cache, random_intervals):
+    """It returns the same recurrences as `get_recurrences()`."""
+    for dt, start, end in random_intervals[:50]:
+        for period in sorted(PERIODS):
+            expected = tuple(get_recurrences(dt, period, start, end))
+            assert expected == cache.get_recurrences(dt, period, start, end)
+
+
+def test_cache__RecurrenceCache__get_recurrences__4(DateTime, cache):
+    """It evicts the least recently used expansion."""
+    dt = DateTime(2016, 2, 6, 10)
+    for month in (3, 4, 3, 5, 3, 4):
+        cache.get_recurrences(
+            dt, 'daily', DateTime(2016, month, 2), DateTime(2016, month, 3))
+    # April got evicted by May:
+    assert (2, 4) == (cache.hits, cache.misses)
+    assert 2 == len(cache)
+
+
+def test_cache__RecurrenceCache__get_recurrences__5(DateTime, cache):
+    """It distinguishes base datetimes at the same time in other zones."""
+    dt = DateTime(2016, 2, 6, 10)
+    other = dt.astimezone(pytz.timezone('Europe/Berlin'))
+    start = DateTime(2016, 7, 1)
+    end = DateTime(2016, 7, 2)
+    assert (DateTime(2016, 7, 1, 10),) == cache.get_recurrences(
+        dt, 'daily', start, end)
+    assert (DateTime(2016, 7, 1, 9),) == cache.get_recurrences(
+        other, 'daily', start, end)
+
+
+def test_cache__RecurrenceCache__clear__1(DateTime, cache):
+    """It removes the entries and resets the counters."""
+    dt = DateTime(2016, 2, 6, 10)
+    cache.get_recurrences(
+        dt, 'daily', DateTime(2016, 3, 2), DateTime(2016, 3, 3))
+    cache.clear()
+    assert (0, 0, 0) == (len(cache), cache.hits, cache.misses)
+
+
+def test_cache__RecurrenceCache__get_recurrences__6(DateTime, cache):
+    """It reuses the expansion of a whole month for intervals within it.
+
+    The end of the interval is not part of it, so an interval ending on the
+    first day of the next month only needs the recurrences of one month.
+    """
+    dt = DateTime(2016, 2, 6, 10)
+    cache.get_recurrences(
+        dt, 'weekly', DateTime(2016, 3, 1), DateTime(2016, 4, 1))
+    assert ((DateTime(2016, 3, 5, 10),) ==
+            cache.get_recurrences(
+                dt, 'weekly', DateTime(2016, 3, 3), DateTime(2016, 3, 6)))
+    assert (1, 1) == (cache.hits, cache.misses)
+
+
+def test_cache__RecurrenceCache__get_recurrences__7(DateTime, cache):
+    """It uses the same expansion for intervals before and after DST start."""
+    tz = pytz.timezone('Europe/Berlin')
+    dt = DateTime(2016, 2, 6, 10, tzinfo=tz)
+    assert ((DateTime(2016, 3, 5, 10, tzinfo=tz),) ==
+            cache.get_recurrences(
+                dt, 'weekly', DateTime(2016, 3, 2, tzinfo=tz),
+                DateTime(2016, 3, 6, tzinfo=tz)))
+    assert ((DateTime(2016, 3, 26, 10, tzinfo=tz),) ==
+            cache.get_recurrences(
+                dt, 'weekly', DateTime(2016, 3, 26, tzinfo=tz),
+                DateTime(2016, 3, 29, tzinfo=tz)))
+    assert (1, 1) == (cache.hits, cache.misses)
+
+
+def test_cache__RecurrenceCache__get_recurrences__8(DateTime, cache):
+    """It returns the recurrences of the date of `interval_start` ...
+
+    ... like `get_recurrences()` for the periods with a fix interval.
+    """
+    dt = DateTime(2016, 2, 6, 10)
+    start = DateTime(2016, 3, 3, 12)
+    end = DateTime(2016, 3, 6, 12)
+    expected = tuple(get_recurrences(dt, 'daily', start, end))
+    assert DateTime(2016, 3, 3, 10) == expected[0]
+    assert expected == cache.get_recurrences(dt, 'daily', start, end)
+    tz = pytz.timezone('Asia/Tokyo')
+    start = DateTime(2016, 3, 1, 0, 30)
+    end = DateTime(2016, 4, 1, 0, 30)
+    dt = DateTime(2016, 2, 6, 1, tzinfo=tz)
+    expected = tuple(get_recurrences(dt, 'daily', start, end))
+    assert DateTime(2016, 3, 1, 1, tzinfo=tz) == expected[0] < start
+    assert expected == cache.get_recurrences(dt, 'daily', start, end)
@@ -0,0 +1,84 @@
+from . import columnar
+from .columnar import expand, from_epoch, to_epoch
+from .core import PERIODS
+from .recurrence import get_recurrences, get_recurrences_bulk
+import datetime
+import pytest
+import pytz
+
+
+def test_columnar__to_epoch__1(DateTime):
+    """It converts aware datetimes to UTC and keeps naive ones."""
+    tz = pytz.timezone('Europe/Berlin')
+    assert 3600 * 10 ** 6 == to_epoch(DateTime(1970, 1, 1, 2, tzinfo=tz))
+    assert 1 == to_epoch(datetime.datetime(1970, 1, 1, 0, 0, 0, 1))
+
+
+@pytest.mark.parametrize('value', [
+    pytz.timezone('Europe/Berlin').localize(
+        datetime.datetime(2016, 10, 30, 2, 30), is_dst=True),
+    pytz.timezone('Europe/Berlin').localize(
+        datetime.datetime(2016, 10, 30, 2, 30), is_dst=False),
+    datetime.datetime(1969, 12, 31, 23, 59, 59, 999999)])
+def test_columnar__from_epoch__1(value):
+    """It restores the datetime converted by `to_epoch()`."""
+    result = from_epoch(to_epoch(value), value.tzinfo)
+    assert value == result
+    assert value.tzinfo == result.tzinfo
+
+
+def test_columnar__expand__1(random_intervals):
+    """It computes the same recurrences as the core classes."""
+    events = [(dt, period)
+              for dt, _, _ in random_intervals[:20] for period in PERIODS]
+    start, end = random_intervals[0][1:]
+    result = expand(events, start, end)
+    expected = [list(PERIODS[period](dt)(start, end))
+                for dt, period in events]
+    assert sum(len(x) for x in expected) == len(result)
+    for number, recurrences in enumerate(expected):
+        # The recurrences at non-existent local times are normalized, so
+        # only the instants and the time zones are the same:
+        datetimes = result.datetimes(number)
+        assert ([(x, x.tzinfo.zone) for x in recurrences] ==
+                [(x, x.tzinfo.zone) for x in datetimes])
+    assert ([(number, x) for number, recurrences in enumerate(expected)
+             for x in recurrences] == list(result))
+
+
+def test_columnar__get_recurrences__1(DateTime):
+    """It returns a sequence creating the datetimes on access."""
+    tz = pytz.timezone('Europe/Berlin')
+    dt = DateTime(2016, 3, 6, 10, tzinfo=tz)
+    start = DateTime(2016, 3, 1)
+    end = DateTime(2016, 4, 30)
+    expected = list(get_recurrences(dt, 'weekly', start, end))
+    result = columnar.get_recurrences(dt, 'weekly', start, end)
+    assert 8 == len(result)
+    assert expected == list(result)
+    assert expected[-1] == result[-1]
+    assert 'CEST' == result[-1].tzname()
+    assert expected[2:4] == list(result[2:4])
+    assert dt.tzinfo is result[2:4].tzinfo
+
+
+def test_columnar__get_recurrences__2():
+    """It supports naive datetimes."""
+    dt = datetime.datetime(2016, 3, 6, 10)
+    start = datetime.datetime(2016, 3, 1)
+    end = datetime.datetime(2016, 3, 8)
+    result = columnar.get_recurrences(dt, 'daily', start, end)
+    assert [dt, dt + datetime.timedelta(days=1)] == list(result)
+
+
+def test_columnar__get_recurrences_bulk__1(random_intervals):
+    """It returns the same recurrences as `get_recurrences_bulk()`."""
+    events = [((number, period), dt, period)
+              for number, (dt, _, _) in enumerate(random_intervals[:20])
+              for period in sorted(PERIODS)]
+    start, end = random_intervals[2][1:]
+    expected = list(get_recurrences_bulk(events, start, end))
+    result = columnar.get_recurrences_bulk(events, start, end)
+    assert expected == list(result)
+    assert ([x for key, x in expected if key == events[3][0]] ==
+            list(result.recurrences(3)))
@@ -0,0 +1,384 @@
+from .core import PERIODS, get_recurrences, recurrences_of_weekday_in_month
+from .core import FoldLocalizer, Localizer, MonthTable, get_localizer
+from .core import SameNthWeekdayInMonthBase, first_of_month, month_index
+from .recurrence import get_recurring
+from .stats import Stats
+import datetime
+import itertools
+import pytest
+import pytz
+import subprocess
+import sys
+import threading
+
+
+def test_core__month_index__1(DateTime):
+    """It is the inverse function of `first_of_month()`."""
+    index = month_index(DateTime(2014, 7, 28, 10))
+    assert 2014 * 12 + 6 == index
+    assert datetime.date(2014, 7, 1) == first_of_month(index)
+
+
+def test_core__MonthTable____call____1():
+    """It returns the isoweekday of the first day and the length of a month.
+
+    The months outside of the years of the table are computed.
+    """
+    table = MonthTable(2000, 2001)
+    for year in (1999, 2000, 2001, 2002):
+        for month in range(1, 13):
+            first = datetime.date(year, month, 1)
+            length = ((first + datetime.timedelta(days=31)).replace(day=1) -
+                      first).days
+            assert (first.isoweekday(), length) == table(
+                month_index(first))
+    assert 24 == len(table.lengths)
+
+
+def test_core__recurrences_of_weekday_in_month__1(DateTime):
+    """It returns the number of recurrences of the weekday in the month."""
+    assert 4 == recurrences_of_weekday_in_month(DateTime(2014, 8, 4), 2014, 7)
+    assert 5 == recurrences_of_weekday_in_month(DateTime(2014, 8, 4), 2014, 6)
+
+
+def test_core__PERIODS__1(DateTime):
+    """It maps the names of the registered adapters to their base classes."""
+    dt = DateTime(2016, 2, 6)
+    for name, class_ in PERIODS.items():
+        assert isinstance(get_recurring(dt, name), class_)
+
+
+def test_core__get_recurrences__1(DateTime):
+    """It returns the same recurrences as the registered adapters."""
+    dt = DateTime(2015, 2, 6, 10)
+    start = DateTime(2016, 1, 1)
+    end = DateTime(2017, 1, 1)
+    for name in PERIODS:
+        expected = list(get_recurring(dt, name)(start, end))
+        assert expected
+        assert expected == list(get_recurrences(dt, name, start, end))
+
+
+def test_core__get_recurrences__2(DateTime):
+    """It raises a `KeyError` for an unknown period."""
+    with pytest.raises(KeyError):
+        get_recurrences(DateTime(2016, 2, 6), 'foobar', None, None)
+
+
+def test_core__1():
+    """It can be imported without importing grok or the component registry."""
+    code = ('import sys, icemac.recurrence.core; '
+            'print(sorted(x for x in sys.modules if x in ('
+            '"grokcore.component", "zope.component", "zope.event", '
+            '"zope.interface")))')
+    assert b'[]' == subprocess.check_output(
+        [sys.executable, '-c', code]).strip()
+
+
+@pytest.mark.parametrize('period', sorted(PERIODS))
+def test_core__RecurringDateTime__nth__1(random_intervals, period):
+    """It returns the same recurrence as the computation from the start."""
+    for dt, start, end in random_intervals[:20]:
+        recurring = PERIODS[period](dt)
+        expected = list(recurring(dt, max(dt, end) + datetime.timedelta(
+            days=800)))
+        for index in (0, 1, len(expected) // 2, len(expected) - 1):
+            assert expected[index] == recurring.nth(index)
+
+
+@pytest.mark.parametrize('period', sorted(PERIODS))
+def test_core__RecurringDateTime__nth__2(DateTime, period):
+    """It raises a `ValueError` for a negative index."""
+    with pytest.raises(ValueError):
+        PERIODS[period](DateTime(2016, 2, 6)).nth(-1)
+
+
+@pytest.mark.parametrize('period', sorted(
+    x for x in PERIODS if issubclass(PERIODS[x], SameNthWeekdayInMonthBase)))
+def test_core__SameNthWeekdayInMonthBase__nth__1(
+        DateTime, monkeypatch, period):
+    """It localizes only the requested recurrence.
+
+    Even if the recurrence does not exist in each month, e. g. the 5th
+    Tuesday or the 5th Tuesday from the end. The indices span more than a
+    cycle of 400 years.
+    """
+    day = 1 if 'from end' in period else 29
+    recurring = PERIODS[period](DateTime(2016, 3, day, 10))
+    assert not recurring._in_each_month
+    expected = list(recurring(
+        recurring.context, DateTime(2016 + 2 * 400, 1, 1)))
+    calls = []
+    localize_month = type(recurring)._localize_month
+    monkeypatch.setattr(
+        type(recurring), '_localize_month',
+        lambda self, month: calls.append(month) or localize_month(
+            self, month))
+    for index in (0, 1, 1000, len(expected) // 2, len(expected) - 1):
+        del calls[:]
+        assert expected[index] == recurring.nth(index)
+        assert 1 == len(calls)
+
+
+@pytest.mark.parametrize('period', sorted(PERIODS))
+def test_core__RecurringDateTime__next_after__1(random_intervals, period):
+    """It returns the first recurrence after the instant."""
+    for dt, start, end in random_intervals:
+        recurring = PERIODS[period](dt)
+        # The rare monthly recurrences are up to two years apart:
+        window = 4 * getattr(recurring, 'interval', datetime.timedelta(200))
+        for instant in (start, recurring.nth(3), dt):
+            expected = [x for x in recurring(instant - window,
+                                             max(dt, instant) + window)
+                        if x > instant][0]
+            assert expected == recurring.next_after(instant)
+
+
+@pytest.mark.parametrize('period', sorted(PERIODS))
+def test_core__RecurringDateTime__previous_before__1(
+        random_intervals, period):
+    """It returns the last recurrence before the instant or `None`."""
+    for dt, start, end in random_intervals:
+        recurring = PERIODS[period](dt)
+        # The rare monthly recurrences are up to two years apart:
+        window = 4 * getattr(recurring, 'interval', datetime.timedelta(200))
+        for instant in (end, recurring.nth(3), dt):
+            expected = ([x for x in recurring(instant - window,
+                                              instant + window)
+                         if x < instant] or [None])[-1]
+            assert expected == recurring.previous_before(instant)
+
+
+@pytest.mark.parametrize('period', sorted(PERIODS))
+def test_core__RecurringDateTime__occurs_on__1(random_intervals, period):
+    """It returns whether there is a recurrence on the date."""
+    for dt, start, end in random_intervals[:50]:
+        recurring = PERIODS[period](dt)
+        dates = set(x.astimezone(dt.tzinfo).date()
+                    for x in recurring(start, end))
+        date = start.astimezone(dt.tzinfo).date() + datetime.timedelta(1)
+        while date < end.astimezone(dt.tzinfo).date():
+            assert (date in dates) == recurring.occurs_on(date)
+            date += datetime.timedelta(1)
+
+
+@pytest.mark.parametrize('period', sorted(PERIODS))
+def test_core__RecurringDateTime____contains____1(random_intervals, period):
+    """It returns whether the instant is a recurrence."""
+    for dt, start, end in random_intervals:
+        recurring = PERIODS[period](dt)
+        for recurrence in recurring(start, end):
+            assert recurrence in recurring
+            assert recurrence + datetime.timedelta(minutes=1) not in recurring
+        assert (dt - datetime.timedelta(days=364)) not in recurring
+
+
+@pytest.mark.parametrize('period', sorted(PERIODS))
+def test_core__RecurringDateTime__reverse__1(random_intervals, period):
+    """It returns the recurrences in the interval in reversed order."""
+    for dt, start, end in random_intervals:
+        recurring = PERIODS[period](dt)
+        expected = list(recurring(start, end))[::-1]
+        assert expected == list(recurring.reverse(start, end))
+
+
+@pytest.mark.parametrize('period', sorted(PERIODS))
+def test_core__RecurringDateTime__reverse__2(DateTime, period):
+    """It computes the recurrences lazily starting at the interval end."""
+    recurring = PERIODS[period](DateTime(1016, 2, 6, 10))
+    end = DateTime(2016, 2, 7)
+    result = recurring.reverse(DateTime(1016, 1, 1), end)
+    assert recurring.previous_before(end) == next(result)
+
+
+@pytest.mark.parametrize('zone', [
+    'UTC', 'Etc/GMT+5', 'Europe/Berlin', 'America/New_York',
+    'Australia/Lord_Howe', 'America/Sao_Paulo', 'Pacific/Kiritimati',
+    'Pacific/Apia'])
+def test_core__Localizer____call____1(zone):
+    """It returns the same results as `tz.localize()`.
+
+    This includes ambiguous and non-existent local times and local times
+    before the first and after the last transition.
+    """
+    tz = pytz.timezone(zone)
+    localize = Localizer(tz)
+    walls = []
+    for year in (2, 1900, 1994, 2011, 2014, 2018, 2037, 2100):
+        wall = datetime.datetime(year, 1, 1, 0, 10)
+        for step in range(2200):
+            walls.append(wall)
+            wall += datetime.timedelta(hours=4, minutes=1)
+    for wall in walls + walls[::-7]:
+        expected = tz.localize(wall)
+        result = localize(wall)
+        assert (expected, expected.tzinfo) == (result, result.tzinfo)
+        assert expected.replace(tzinfo=None) == result.replace(tzinfo=None)
+
+
+def test_core__Localizer___remember__1():
+    """It does not remember a range between transitions close to each other.
+    """
+    hour = datetime.timedelta(hours=1)
+
+    class Close(pytz.tzinfo.DstTzInfo):
+        zone = 'Close'
+        _utc_transition_times = [
+            datetime.datetime(1, 1, 1),
+            datetime.datetime(2000, 3, 1, 1),
+            datetime.datetime(2000, 3, 2, 13)]
+        _transition_info = [
+            (hour, datetime.timedelta(0), 'STD'),
+            (2 * hour, hour, 'DST'),
+            (hour, datetime.timedelta(0), 'STD')]
+
+    tz = Close()
+    localize = Localizer(tz)
+    wall = datetime.datetime(2000, 3, 2, 12)
+    expected = tz.localize(wall)
+    assert 'DST' == expected.tzname()
+    assert (expected, expected.tzinfo) == (
+        localize(wall), localize(wall).tzinfo)
+    assert datetime.datetime.max == localize.run[0]
+
+
+@pytest.mark.parametrize('zone', [
+    'UTC', 'Europe/Berlin', 'America/New_York', 'Australia/Lord_Howe',
+    'America/Sao_Paulo', 'Pacific/Apia', 'Europe/Dublin'])
+def test_core__FoldLocalizer____call____1(zone):
+    """It returns the same instants as `tz.localize()` of pytz.
+
+    (The years before 1970 are not compared as the time zone databases of
+    pytz and the system might differ for them.)
+    """
+    zoneinfo = pytest.importorskip('zoneinfo')
+    tz = pytz.timezone(zone)
+    localize = FoldLocalizer(zoneinfo.ZoneInfo(zone))
+    for year in (1994, 2011, 2018, 2037):
+        wall = datetime.datetime(year, 1, 1, 0, 10)
+        for step in range(2200):
+            # Ambiguous datetimes with `fold` never compare equal to ones in
+            # other time zones, so we compare the offsets:
+            assert tz.localize(wall).utcoffset() == localize(wall).utcoffset()
+            wall += datetime.timedelta(hours=4, minutes=1)
+
+
+def test_core__get_localizer__1():
+    """It returns a localizer matching the time zone implementation."""
+    fixed = datetime.timezone(datetime.timedelta(hours=-3))
+    assert isinstance(get_localizer(pytz.utc), Localizer)
+    assert isinstance(get_localizer(fixed), FoldLocalizer)
+    wall = datetime.datetime(2016, 2, 6, 10)
+    assert wall is get_localizer(None)(wall)
+
+
+def test_core__get_localizer__2():
+    """It shares the localizer of a time zone."""
+    tz = pytz.timezone('Europe/Berlin')
+    assert get_localizer(tz) is get_localizer(tz)
+
+
+@pytest.mark.parametrize('period', sorted(PERIODS))
+def test_core__RecurringDateTime__1(random_intervals, period):
+    """It computes the same recurrences for `zoneinfo` time zones."""
+    zoneinfo = pytest.importorskip('zoneinfo')
+    for dt, start, end in random_intervals[:50]:
+        dt_zoneinfo = dt.astimezone(zoneinfo.ZoneInfo(dt.tzinfo.zone))
+        expected = list(PERIODS[period](dt)(start, end))
+        recurring = PERIODS[period](dt_zoneinfo)
+        result = list(recurring(start, end))
+        assert ([(x.replace(tzinfo=None), x.utcoffset()) for x in expected] ==
+                [(x.replace(tzinfo=None), x.utcoffset()) for x in result])
+        assert len(result) == recurring.count(start, end)
+
+
+@pytest.mark.parametrize('period', sorted(PERIODS))
+def test_core__RecurringDateTime__2(DateTime, period):
+    """It computes naive recurrences for a naive context."""
+    dt = DateTime(2015, 2, 6, 10)
+    start = DateTime(2016, 1, 1)
+    end = DateTime(2018, 1, 1)
+    expected = [x.replace(tzinfo=None)
+                for x in PERIODS[period](dt)(start, end)]
+    recurring = PERIODS[period](dt.replace(tzinfo=None))
+    assert expected == list(recurring(
+        start.replace(tzinfo=None), end.replace(tzinfo=None)))
+    assert expected[-1] in recurring
+    assert expected[1] == recurring.next_after(expected[0])
+
+
+@pytest.mark.parametrize('period', sorted(PERIODS))
+def test_core__RecurringDateTime__3(random_intervals, period):
+    """It stores no state, so an instance can be reused for many intervals.
+
+    The generators of different intervals can even be interleaved.
+    """
+    dt, start, end = random_intervals[0]
+    recurring = PERIODS[period](dt)
+    with pytest.raises(AttributeError):
+        recurring.__dict__
+    intervals = [(start, end), (start - datetime.timedelta(days=400), start),
+                 (end, end + datetime.timedelta(days=900))]
+    expected = [list(PERIODS[period](dt)(*x)) for x in intervals]
+    generators = [recurring(*x) for x in intervals]
+    result = [[] for x in intervals]
+    for step in range(max(len(x) for x in expected)):
+        for results, generator in zip(result, generators):
+            results.extend(itertools.islice(generator, 1))
+    assert expected == result
+
+
+def test_core__RecurringDateTime__4(random_intervals):
+    """An instance can be called concurrently from many threads."""
+    dt, start, end = random_intervals[1]
+    end = start + datetime.timedelta(days=3000)
+    recurring = PERIODS['nth weekday from end of other month'](dt)
+    expected = list(recurring(start, end))
+    results = []
+
+    def compute():
+        results.append(list(recurring(start, end)))
+
+    threads = [threading.Thread(target=compute) for x in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [expected] * 8 == results
+
+
+@pytest.mark.parametrize('period', sorted(
+    x for x in PERIODS if issubclass(PERIODS[x], SameNthWeekdayInMonthBase)))
+def test_core__SameNthWeekdayInMonthBase__count__1(period):
+    """It counts a recurrence in the month before the one of `interval_start`.
+
+    This happens if the recurrence is in another time zone than the interval.
+    """
+    tz = pytz.timezone('Pacific/Honolulu')
+    hour = datetime.timedelta(hours=1)
+    for day in range(1, 32):
+        recurring = PERIODS[period](
+            tz.localize(datetime.datetime(2016, 1, day, 23)))
+        for recurrence in [recurring.nth(x) for x in range(12)]:
+            start = pytz.utc.normalize(recurrence)
+            assert [recurrence] == list(recurring(start, start + hour))
+            assert 1 == recurring.count(start, start + hour)
+
+
+@pytest.mark.parametrize('period', sorted(
+    x for x in PERIODS if issubclass(PERIODS[x], SameNthWeekdayInMonthBase)))
+def test_core__SameNthWeekdayInMonthBase__compute__1(random_intervals, period):
+    """It only computes the recurrences in the interval.
+
+    The months without the weekday and the months before the recurrence
+    start are skipped without computing their recurrence.
+    """
+    hour = datetime.timedelta(hours=1)
+    for dt, _, _ in random_intervals[:50]:
+        recurring = PERIODS[period](dt)
+        expected = [recurring.nth(x) for x in range(2, 21)]
+        with Stats() as stats:
+            for start in (expected[0] - hour, dt - datetime.timedelta(9999)):
+                result = list(recurring(start, expected[-1] + hour))
+                assert expected == result[-len(expected):]
+        assert 0 == stats.periods[period].skipped
@@ -22,3 +22,10 @@ def test_daily__Daily____call____1(DateTime):
 def test_daily__Daily__info__1(info):
     """It renders a static string."""
     assert u'each day' == info(Daily, None)
+
+
+def test_daily__Daily__count__1(random_intervals):
+    """It returns the number of recurrences in the interval."""
+    for dt, start, end in random_intervals:
+        assert len(list(Daily(dt)(start, end))) == Daily(dt).count(
+            start, end)
@@ -0,0 +1,121 @@
+from .core import PERIODS, RecurringDateTime
+from .index import RecurrenceIndex
+import datetime
+import pytest
+
+
+@pytest.fixture(scope='module')
+def index(random_intervals):
+    """Index of the events of `random_intervals` in each period."""
+    index = RecurrenceIndex()
+    for number, (dt, _, _) in enumerate(random_intervals):
+        for period in PERIODS:
+            index.add((number, period), dt, period)
+    return index
+
+
+def test_index__RecurrenceIndex__add__1(DateTime):
+    """It replaces an event with the same key."""
+    index = RecurrenceIndex()
+    index.add('a', DateTime(2016, 2, 6), 'daily')
+    index.add('a', DateTime(2016, 2, 6), 'yearly')
+    assert 1 == len(index)
+    assert 'a' in index
+    assert [] == index.query(DateTime(2016, 3, 1), DateTime(2016, 4, 1))
+
+
+def test_index__RecurrenceIndex__add__2(DateTime):
+    """It raises a `KeyError` for an unknown period."""
+    with pytest.raises(KeyError):
+        RecurrenceIndex().add('a', DateTime(2016, 2, 6), 'foobar')
+
+
+def test_index__RecurrenceIndex__remove__1(DateTime):
+    """It removes the event from the index."""
+    index = RecurrenceIndex()
+    index.add('a', DateTime(2016, 2, 6), 'daily')
+    index.add('b', DateTime(2016, 2, 7), 'daily')
+    start = DateTime(2016, 3, 1)
+    end = DateTime(2016, 4, 1)
+    index.remove('a')
+    assert ['b'] == index.query(start, end)
+    index.remove('b')
+    assert 0 == len(index)
+    assert [] == index.query(start, end)
+
+
+def test_index__RecurrenceIndex__remove__2():
+    """It raises a `KeyError` for an unknown event."""
+    with pytest.raises(KeyError):
+        RecurrenceIndex().remove('a')
+
+
+def test_index__RecurrenceIndex__query__1(random_intervals, index):
+    """It returns the events with at least one recurrence in the interval."""
+    for _, start, end in random_intervals[:20]:
+        expected = set(
+            (number, period)
+            for number, (dt, _, _) in enumerate(random_intervals)
+            for period in PERIODS
+            if PERIODS[period](dt).count(start, end))
+        assert expected == set(index.query(start, end))
+
+
+def test_index__RecurrenceIndex__query__2(
+        random_intervals, index, monkeypatch):
+    """It only checks the events in matching buckets for a short interval."""
+    start = random_intervals[0][1]
+    end = start + datetime.timedelta(days=7)
+    checked = []
+
+    def spy(original):
+        def count(self, *args):
+            checked.append(self)
+            return original(self, *args)
+        return count
+
+    for class_ in set(PERIODS.values()):
+        monkeypatch.setattr(class_, 'count', spy(class_.count))
+    assert index.query(start, end)
+    assert len(checked) < len(index) / 2
+
+
+def test_index__RecurrenceIndex__query__3(DateTime):
+    """It returns the recurrences on the 29th of February in other years."""
+    index = RecurrenceIndex()
+    index.add('a', DateTime(2016, 2, 29, 10), 'yearly')
+    assert ['a'] == index.query(DateTime(2017, 2, 28), DateTime(2017, 3, 1))
+
+
+def test_index__RecurrenceIndex__query__4():
+    """It supports naive datetimes."""
+    index = RecurrenceIndex()
+    index.add('meeting', datetime.datetime(2015, 10, 13, 11, 15), 'weekly')
+    index.add('birthday', datetime.datetime(1980, 10, 20), 'yearly')
+    assert [] == index.query(
+        datetime.datetime(2015, 10, 14), datetime.datetime(2015, 10, 19))
+    assert ['birthday', 'meeting'] == sorted(index.query(
+        datetime.datetime(2015, 10, 20), datetime.datetime(2015, 10, 21)))
+
+
+def test_index__RecurrenceIndex__query__5():
+    """It supports `zoneinfo` time zones."""
+    zoneinfo = pytest.importorskip('zoneinfo')
+    tz = zoneinfo.ZoneInfo('Pacific/Auckland')
+    index = RecurrenceIndex()
+    index.add('meeting', datetime.datetime(2015, 10, 13, 8, tzinfo=tz),
+              'weekly')
+    assert [] == index.query(
+        datetime.datetime(2015, 10, 14, tzinfo=tz),
+        datetime.datetime(2015, 10, 20, tzinfo=tz))
+    assert ['meeting'] == index.query(
+        datetime.datetime(2015, 10, 20, 7, tzinfo=tz),
+        datetime.datetime(2015, 10, 20, 9, tzinfo=tz))
+
+
+def test_index__RecurringDateTime___bucket__1():
+    """It needs to be implemented by child classes."""
+    with pytest.raises(NotImplementedError):
+        RecurringDateTime(None)._bucket()
+    with pytest.raises(NotImplementedError):
+        RecurringDateTime._buckets_on(None)
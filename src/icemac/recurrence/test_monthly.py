@@ -1,4 +1,5 @@
 import pytz
+from .core import SameNthWeekdayInMonthBase, month_index, month_table
 from .interfaces import IRecurringDateTime
 from .monthly import MonthlyNthWeekday, BiMonthlyNthWeekday
 from .monthly import MonthlyNthWeekdayFromEnd, BiMonthlyNthWeekdayFromEnd
@@ -271,6 +272,19 @@ def test_monthly__MonthlyNthWeekdayFromEnd____call____6(DateTime):
         DateTime(2014, 8, 2, 0)] == result
 
 
+def test_monthly__MonthlyNthWeekdayFromEnd____call____7(DateTime):
+    """It returns a recurrence in the month before `interval_start` ...
+
+    ... in the time zone of the recurrence start if it is in the interval.
+    """
+    dt = DateTime(2016, 1, 31, 23, tzinfo=pytz.timezone('Pacific/Honolulu'))
+    start = DateTime(2016, 8, 1)
+    end = DateTime(2016, 8, 2)
+    adapter = MonthlyNthWeekdayFromEnd(dt)
+    assert [DateTime(2016, 8, 1, 9)] == list(adapter(start, end))
+    assert 1 == adapter.count(start, end)
+
+
 def test_monthly__BiMonthlyNthWeekdayFromEnd__1(today):
     """It fulfills the `IRecurringDateTime` interface."""
     assert verifyObject(IRecurringDateTime, BiMonthlyNthWeekdayFromEnd(today))
@@ -297,6 +311,15 @@ def test_monthly__BiMonthlyNthWeekdayFromEnd____call____1(
     assert recurrence_start.isoweekday() == result[0].isoweekday()
 
 
+def test_monthly__MonthlyNthWeekdayFromEnd___n_in_month__1(
+        DateTime, recurrence_start):
+    """It is the zero based week of the recurrence in the given month."""
+    adapter = MonthlyNthWeekdayFromEnd(recurrence_start)
+    month = month_table(month_index(DateTime(2014, 4, 1)))
+    # last but one Thursday is the 3rd Thursday:
+    assert 2 == adapter._n_in_month(*month)
+
+
 def test_monthly__BiMonthlyNthWeekdayFromEnd____call____2(DateTime):
     """It computes a correct time and time zone at DST changes.
 
@@ -310,3 +333,47 @@ def test_monthly__BiMonthlyNthWeekdayFromEnd____call____2(DateTime):
     result = list(BiMonthlyNthWeekdayFromEnd(
         recurrence_start)(interval_start, interval_end))
     assert [DateTime(2017, 3, 28, 10, 0, tzinfo=tz_berlin)] == result
+
+
+@pytest.mark.parametrize('adapter', [
+    MonthlyNthWeekday, BiMonthlyNthWeekday,
+    MonthlyNthWeekdayFromEnd, BiMonthlyNthWeekdayFromEnd])
+def test_monthly__SameNthWeekdayInMonthBase__count__1(
+        random_intervals, adapter):
+    """It returns the number of recurrences in the interval."""
+    for dt, start, end in random_intervals:
+        assert len(list(adapter(dt)(start, end))) == adapter(dt).count(
+            start, end)
+
+
+def test_monthly__SameNthWeekdayInMonthBase__count__2(DateTime):
+    """It compares the months around the interval bounds exactly."""
+    tz_kiritimati = pytz.timezone('Pacific/Kiritimati')  # UTC+14
+    dt = DateTime(2014, 1, 2, 1, tzinfo=tz_kiritimati)
+    # The first recurrences in the interval are 2014-05-01, 01:00 and
+    # 2015-01-01, 01:00 which are at 11:00 on the previous day in UTC:
+    start = DateTime(2014, 4, 30, 10)
+    end = DateTime(2014, 12, 31, 12)
+    adapter = MonthlyNthWeekday(dt)
+    assert 9 == len(list(adapter(start, end))) == adapter.count(start, end)
+    assert 8 == adapter.count(DateTime(2014, 4, 30, 12), end)
+    assert 8 == adapter.count(start, DateTime(2014, 12, 31, 10))
+
+
+def test_monthly__SameNthWeekdayInMonthBase___in_each_month__1():
+    """It needs to be implemented by child classes."""
+    with pytest.raises(NotImplementedError):
+        SameNthWeekdayInMonthBase(None)._in_each_month
+
+
+@pytest.mark.parametrize('adapter, dt', [
+    (MonthlyNthWeekday, (2014, 7, 29, 10)),
+    (BiMonthlyNthWeekday, (2014, 7, 29, 10)),
+    (MonthlyNthWeekdayFromEnd, (2014, 7, 1, 10)),
+    (BiMonthlyNthWeekdayFromEnd, (2014, 7, 1, 10))])
+def test_monthly__SameNthWeekdayInMonthBase__nth__1(DateTime, adapter, dt):
+    """It skips whole 400 year cycles if the weekday is not in each month."""
+    recurring = adapter(DateTime(*dt))
+    recurrences = list(recurring(recurring.context, DateTime(2900, 1, 1)))
+    for index in (len(recurrences) - 1, 500, 1):
+        assert recurrences[index] == recurring.nth(index)
@@ -0,0 +1,35 @@
+from .columnar import expand
+from .core import PERIODS
+import concurrent.futures
+import icemac.recurrence.parallel
+import pytest
+
+
+@pytest.fixture(scope='module')
+def events(random_intervals):
+    """Events of `random_intervals` in each period."""
+    return [(dt, period)
+            for dt, _, _ in random_intervals[:30] for period in PERIODS]
+
+
+def assert_equal(expected, result):
+    """Assert that two `EpochRecurrences` instances are equal."""
+    assert expected.counts == result.counts
+    assert expected.instants == result.instants
+    assert expected.tzinfos == result.tzinfos
+
+
+def test_parallel__expand__1(random_intervals, events):
+    """It computes the recurrences in worker processes in a fix order."""
+    start, end = random_intervals[0][1:]
+    assert_equal(expand(events, start, end), icemac.recurrence.parallel.expand(
+        events, start, end, max_workers=2, chunksize=7))
+
+
+def test_parallel__expand__2(random_intervals, events):
+    """It can use an existing executor."""
+    start, end = random_intervals[1][1:]
+    with concurrent.futures.ThreadPoolExecutor(3) as executor:
+        result = icemac.recurrence.parallel.expand(
+            iter(events), start, end, executor=executor)
+    assert_equal(expand(events, start, end), result)
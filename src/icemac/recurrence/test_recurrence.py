@@ -1,8 +1,36 @@
+from . import core
+from .interfaces import IRecurringDateTime
+from .recurrence import _factories, _lookup_factory, clear_cache
 from .recurrence import get_recurring, get_recurrences
+from .recurrence import get_recurrences_bulk, get_recurrences_merged
 from .weekly import Weekly
 from zope.component import ComponentLookupError
 import collections
+import datetime
+import gc
+import grokcore.component.util
+import itertools
 import pytest
+import random
+import threading
+import zope.component
+import zope.interface.common.idatetime
+import zope.interface.registry
+
+
+class CustomWeekly(Weekly):
+    """Recurrence adapter overriding `Weekly`."""
+
+
+@pytest.fixture(scope='function')
+def customWeekly():
+    """Register `CustomWeekly` as override for `Weekly` for a single test."""
+    registry = zope.component.getGlobalSiteManager()
+    args = ((zope.interface.common.idatetime.IDateTime,), IRecurringDateTime,
+            'weekly')
+    registry.registerAdapter(CustomWeekly, *args)
+    yield
+    registry.registerAdapter(Weekly, *args)
 
 
 def test_recurrence__get_recurring__1(DateTime):
@@ -16,6 +44,95 @@ def test_recurrence__get_recurring__2(DateTime):
         get_recurring(DateTime(2016, 2, 6), 'foobar')
 
 
+def test_recurrence__get_recurring__3(DateTime):
+    """It caches the looked up adapter factory per registry."""
+    clear_cache()
+    dt = DateTime(2016, 2, 6)
+    get_recurring(dt, 'weekly')
+    registry = zope.component.getGlobalSiteManager().adapters
+    generation, factories = _factories[registry]
+    assert registry._generation == generation
+    assert [Weekly] == list(factories.values())
+    assert Weekly == get_recurring(dt, 'weekly').__class__
+
+
+def test_recurrence__get_recurring__4(DateTime, customWeekly):
+    """It respects adapters registered after filling the cache."""
+    dt = DateTime(2016, 2, 6)
+    assert CustomWeekly == get_recurring(dt, 'weekly').__class__
+
+
+def test_recurrence__get_recurring__5(DateTime):
+    """It respects adapters registered without sending an event.
+
+    Grok registers the adapters this way.
+    """
+    dt = DateTime(2016, 2, 6)
+    get_recurring(dt, 'weekly')
+    args = ((zope.interface.common.idatetime.IDateTime,), IRecurringDateTime,
+            'weekly')
+    grokcore.component.util.provideAdapter(CustomWeekly, *args)
+    try:
+        assert CustomWeekly == get_recurring(dt, 'weekly').__class__
+    finally:
+        grokcore.component.util.provideAdapter(Weekly, *args)
+    assert Weekly == get_recurring(dt, 'weekly').__class__
+
+
+def test_recurrence__get_recurring__6(DateTime):
+    """It does not keep registries which are no longer used.
+
+    E. g. `zope.component.testing.tearDown()` replaces the registries.
+    """
+    dt = DateTime(2016, 2, 6)
+    site_manager = zope.interface.registry.Components()
+    site_manager.registerAdapter(
+        CustomWeekly, (zope.interface.common.idatetime.IDateTime,),
+        IRecurringDateTime, 'weekly')
+    assert CustomWeekly == _lookup_factory(dt, 'weekly', site_manager)
+    assert site_manager.adapters in _factories
+    length = len(_factories)
+    del site_manager
+    gc.collect()
+    assert length - 1 == len(_factories)
+
+
+class IMarker(zope.interface.Interface):
+    """Marker interface of a datetime."""
+
+
+class MarkableDateTime(datetime.datetime):
+    """Datetime whose instances can provide further interfaces."""
+
+
+def test_recurrence__get_recurring__7():
+    """It caches the factory by the type of the datetime ...
+
+    ... but respects the interfaces an instance provides on its own.
+    """
+    site_manager = zope.interface.registry.Components()
+    site_manager.registerAdapter(
+        Weekly, (zope.interface.common.idatetime.IDateTime,),
+        IRecurringDateTime, 'weekly')
+    site_manager.registerAdapter(
+        CustomWeekly, (IMarker,), IRecurringDateTime, 'weekly')
+    dt = MarkableDateTime(2016, 2, 6)
+    marked = MarkableDateTime(2016, 2, 6)
+    zope.interface.alsoProvides(marked, IMarker)
+    assert Weekly == _lookup_factory(dt, 'weekly', site_manager)
+    assert CustomWeekly == _lookup_factory(marked, 'weekly', site_manager)
+    assert Weekly == _lookup_factory(dt, 'weekly', site_manager)
+    assert Weekly == _lookup_factory(
+        datetime.datetime(2016, 2, 6), 'weekly', site_manager)
+
+
+def test_recurrence__clear_cache__1(DateTime):
+    """It empties the cache."""
+    get_recurring(DateTime(2016, 2, 6), 'weekly')
+    clear_cache()
+    assert 0 == len(_factories)
+
+
 def test_recurrence__get_recurrences__1(DateTime):
     """It returns an iterable of datetime objects."""
     dt = DateTime(2016, 2, 6, 10)
@@ -26,3 +143,149 @@ def test_recurrence__get_recurrences__1(DateTime):
     assert isinstance(result, collections.Iterable)
     assert [DateTime(2016, 4, 9, 10),
             DateTime(2016, 6, 4, 10)] == list(result)
+
+
+def test_recurrence__get_recurrences_bulk__1(DateTime):
+    """It returns the recurrences of all events together with their keys."""
+    start = DateTime(2016, 3, 1)
+    end = DateTime(2016, 3, 18)
+    events = [
+        ('a', DateTime(2016, 2, 6, 10), 'weekly'),
+        ('b', DateTime(2016, 3, 16, 8), 'daily'),
+        ('c', DateTime(2016, 2, 9, 11), 'weekly'),
+    ]
+    assert [
+        ('a', DateTime(2016, 3, 5, 10)),
+        ('a', DateTime(2016, 3, 12, 10)),
+        ('b', DateTime(2016, 3, 16, 8)),
+        ('b', DateTime(2016, 3, 17, 8)),
+        ('c', DateTime(2016, 3, 1, 11)),
+        ('c', DateTime(2016, 3, 8, 11)),
+        ('c', DateTime(2016, 3, 15, 11)),
+    ] == list(get_recurrences_bulk(events, start, end))
+
+
+def test_recurrence__get_recurrences_bulk__2(DateTime):
+    """It returns the same recurrences as `get_recurrences`."""
+    start = DateTime(2016, 1, 1)
+    end = DateTime(2017, 1, 1)
+    dt = DateTime(2015, 2, 6, 10)
+    periods = ['daily', 'weekly', 'biweekly', 'nth weekday of month',
+               'nth weekday every other month',
+               'nth weekday from end of month',
+               'nth weekday from end of other month', 'yearly']
+    events = [(period, dt, period) for period in periods]
+    expected = [(period, x)
+                for period in periods
+                for x in get_recurrences(dt, period, start, end)]
+    assert expected == list(get_recurrences_bulk(events, start, end))
+
+
+def test_recurrence__get_recurrences_bulk__3(DateTime):
+    """It raises a ComponentLookupError for an unknown period."""
+    events = [('a', DateTime(2016, 2, 6), 'foobar')]
+    with pytest.raises(ComponentLookupError):
+        list(get_recurrences_bulk(
+            events, DateTime(2016, 3, 1), DateTime(2016, 4, 1)))
+
+
+def test_recurrence__get_recurrences_merged__1(DateTime):
+    """It returns the recurrences of all events in chronological order."""
+    start = DateTime(2016, 3, 1)
+    end = DateTime(2016, 3, 18)
+    events = [
+        ('a', DateTime(2016, 2, 6, 10), 'weekly'),
+        ('b', DateTime(2016, 3, 16, 8), 'daily'),
+        ('c', DateTime(2016, 2, 9, 11), 'weekly'),
+        ('d', DateTime(2016, 3, 8, 11), 'yearly'),
+    ]
+    assert [
+        ('c', DateTime(2016, 3, 1, 11)),
+        ('a', DateTime(2016, 3, 5, 10)),
+        ('c', DateTime(2016, 3, 8, 11)),
+        ('d', DateTime(2016, 3, 8, 11)),
+        ('a', DateTime(2016, 3, 12, 10)),
+        ('c', DateTime(2016, 3, 15, 11)),
+        ('b', DateTime(2016, 3, 16, 8)),
+        ('b', DateTime(2016, 3, 17, 8)),
+    ] == list(get_recurrences_merged(events, start, end))
+
+
+def test_recurrence__get_recurrences_merged__2(random_intervals):
+    """It returns the same recurrences as `get_recurrences_bulk`."""
+    start = random_intervals[0][1]
+    end = random_intervals[0][2]
+    events = [(number, dt, 'nth weekday of month')
+              for number, (dt, _, _) in enumerate(random_intervals)]
+    expected = sorted(get_recurrences_bulk(events, start, end),
+                      key=lambda x: (x[1], x[0]))
+    assert expected == list(get_recurrences_merged(events, start, end))
+
+
+def test_recurrence__get_recurrences_merged__3(DateTime):
+    """It computes the recurrences lazily."""
+    events = [('a', DateTime(2016, 2, 6, 10), 'daily'),
+              ('b', DateTime(2016, 2, 6, 9), 'daily')]
+    merged = get_recurrences_merged(
+        events, DateTime(2016, 1, 1), DateTime(9999, 1, 1))
+    assert [
+        ('b', DateTime(2016, 2, 6, 9)),
+        ('a', DateTime(2016, 2, 6, 10)),
+        ('b', DateTime(2016, 2, 7, 9)),
+    ] == list(itertools.islice(merged, 3))
+
+
+def test_recurrence__1(random_intervals):
+    """The adapters can be shared between threads.
+
+    Each thread expands all events in a different order and gets the same
+    recurrences as a single thread.
+    """
+    start = random_intervals[0][1]
+    end = start + datetime.timedelta(days=800)
+    adapters = [get_recurring(dt, period)
+                for dt, _, _ in random_intervals[:50]
+                for period in sorted(core.PERIODS)]
+    expected = [list(x(start, end)) for x in adapters]
+    results = {}
+
+    def expand(number):
+        order = list(range(len(adapters)))
+        random.Random(number).shuffle(order)
+        result = [None] * len(adapters)
+        for position in order:
+            result[position] = list(adapters[position](start, end))
+        results[number] = result
+
+    threads = [threading.Thread(target=expand, args=(x,)) for x in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert 8 == len(results)
+    for result in results.values():
+        assert expected == result
+
+
+def test_recurrence__2():
+    """The package exports its functions."""
+    import icemac.recurrence
+    assert get_recurrences is icemac.recurrence.get_recurrences
+    assert get_recurrences_bulk is icemac.recurrence.get_recurrences_bulk
+    assert get_recurrences_merged is icemac.recurrence.get_recurrences_merged
+    assert get_recurring is icemac.recurrence.get_recurring
+    with pytest.raises(AttributeError):
+        icemac.recurrence.foo
+
+
+def test_recurrence__3():
+    """The package stores its functions on first access ...
+
+    ... and lists them in `dir()`.
+    """
+    import icemac.recurrence
+    icemac.recurrence.get_recurring
+    assert get_recurring is vars(icemac.recurrence)['get_recurring']
+    assert {'get_recurrences', 'get_recurrences_bulk',
+            'get_recurrences_merged', 'get_recurring'} <= set(
+        dir(icemac.recurrence))
@@ -0,0 +1,76 @@
+from . import core
+from .monthly import MonthlyNthWeekday
+from .stats import Stats
+from .weekly import Weekly
+from .yearly import Yearly
+import pytest
+
+
+def test_stats__Stats__1(DateTime):
+    """It records the calls and recurrences per period while it is active."""
+    start = DateTime(2016, 1, 1)
+    end = DateTime(2016, 12, 31)
+    weekly = Weekly(DateTime(2016, 2, 4, 10))
+    with Stats() as stats:
+        assert 48 == len(list(weekly(start, end)))
+        assert 12 == len(list(weekly(start, DateTime(2016, 4, 28))))
+    list(weekly(start, end))
+    assert ['weekly'] == list(stats.periods)
+    result = stats.periods['weekly']
+    assert 2 == result.calls
+    assert 60 == result.recurrences
+    assert 0 == result.skipped
+    assert 0 < result.seconds
+    assert repr(result).startswith(
+        '<PeriodStats calls=2 recurrences=60 skipped=0 seconds=')
+
+
+def test_stats__Stats__2(DateTime):
+    """It records the computed recurrences which are not in the interval."""
+    # The 5th Tuesday of the month:
+    monthly = MonthlyNthWeekday(DateTime(2016, 3, 29, 10))
+    with Stats() as stats:
+        result = list(monthly(DateTime(2016, 5, 31, 11), DateTime(2017, 1, 1)))
+    assert [DateTime(2016, 8, 30, 10), DateTime(2016, 11, 29, 10)] == result
+    # The recurrence on the day of the start of the interval is within the
+    # margin of two days, so it gets localized before being skipped:
+    assert 1 == stats.periods['nth weekday of month'].skipped
+
+
+def test_stats__Stats__3(DateTime):
+    """It records the years stepped through to find the first recurrence."""
+    yearly = Yearly(DateTime(2010, 3, 1, 10))
+    with Stats() as stats:
+        result = list(yearly(DateTime(2016, 6, 1), DateTime(2019, 1, 1)))
+    assert [DateTime(2017, 3, 1, 10), DateTime(2018, 3, 1, 10)] == result
+    assert 2 == stats.periods['yearly'].skipped
+
+
+def test_stats__Stats__4(DateTime):
+    """It uses the name of the class if it does not compute a period."""
+    class Recurring(core.RecurringDateTime):
+        def compute(self, interval_start, interval_end):
+            return iter(range(interval_start, interval_end))
+
+    with Stats() as stats:
+        assert [2, 3] == list(Recurring(None)(2, 4))
+    assert 2 == stats.periods['Recurring'].recurrences
+
+
+def test_stats__Stats__stop__1():
+    """It does not stop an other active instance."""
+    stats = Stats()
+    with Stats() as other:
+        stats.stop()
+        assert other is core._stats
+    assert core._stats is None
+
+
+@pytest.mark.parametrize('period', sorted(core.PERIODS))
+def test_stats__Stats__5(random_intervals, period):
+    """It does not change the computed recurrences."""
+    dt, start, end = random_intervals[3]
+    expected = list(core.PERIODS[period](dt)(start, end))
+    with Stats() as stats:
+        assert expected == list(core.PERIODS[period](dt)(start, end))
+    assert len(expected) == stats.periods[period].recurrences
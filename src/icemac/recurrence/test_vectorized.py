@@ -0,0 +1,226 @@
+from .core import PERIODS as CORE_PERIODS
+from .vectorized import compute, compute_many, localize, _localize
+from .vectorized import _to_walls_and_utc
+import datetime
+import numpy
+import pytest
+import pytz
+
+
+tz_berlin = pytz.timezone('Europe/Berlin')
+tz_new_york = pytz.timezone('America/New_York')
+tz_lord_howe = pytz.timezone('Australia/Lord_Howe')
+
+PERIODS = ['daily', 'weekly', 'biweekly']
+MONTHLY_PERIODS = [
+    'nth weekday of month',
+    'nth weekday every other month',
+    'nth weekday from end of month',
+    'nth weekday from end of other month',
+]
+
+
+def expected(context, period, start, end):
+    """Compute the recurrences using the adapters."""
+    return list(CORE_PERIODS[period](context)(start, end))
+
+
+def assert_same(occurrences, recurrences):
+    """Assert that the occurrences match the recurrences of the adapters."""
+    datetimes = occurrences.datetimes()
+    assert recurrences == datetimes
+    assert [x.tzinfo for x in recurrences] == [x.tzinfo for x in datetimes]
+    assert [x.replace(tzinfo=None) for x in recurrences] == (
+        occurrences.walls.astype(object).tolist())
+    assert [pytz.utc.normalize(x).replace(tzinfo=None)
+            for x in recurrences] == occurrences.utc.astype(object).tolist()
+
+
+def test_vectorized__localize__1():
+    """It returns the UTC instants of the local times."""
+    walls = numpy.array(['2016-03-27T01:30', '2016-03-27T03:30'],
+                        dtype='datetime64[us]')
+    assert [datetime.datetime(2016, 3, 27, 0, 30),
+            datetime.datetime(2016, 3, 27, 1, 30)] == localize(
+        tz_berlin, walls).astype(object).tolist()
+
+
+def test_vectorized___localize__1():
+    """It returns the same UTC instants and time zones as `localize()` ...
+
+    ... at DST changes.
+    """
+    for tz in (tz_berlin, tz_new_york, tz_lord_howe, pytz.utc,
+               pytz.timezone('Etc/GMT+5'), pytz.timezone('Europe/Warsaw')):
+        walls = [datetime.datetime(year, month, day, hour, minute)
+                 for year in (1915, 2016)
+                 for month in (3, 4, 8, 10, 11)
+                 for day in range(1, 29, 3)
+                 for hour in range(0, 4)
+                 for minute in (0, 30)]
+        utc, tzinfos = _localize(
+            tz, numpy.array(walls, dtype='datetime64[us]'))
+        assert [pytz.utc.normalize(tz.localize(x)).replace(tzinfo=None)
+                for x in walls] == utc.astype(object).tolist()
+        assert [tz.localize(x).tzinfo for x in walls] == tzinfos.tolist()
+
+
+def test_vectorized___to_walls_and_utc__1():
+    """It returns the local times and UTC instants of the datetimes.
+
+    Naive datetimes are taken as UTC.
+    """
+    values = [tz_berlin.localize(datetime.datetime(2016, 3, 27, 3, 30, 1, 2)),
+              tz_lord_howe.localize(datetime.datetime(1969, 12, 31, 23)),
+              datetime.datetime(2016, 2, 29, 12, 15)]
+    walls, utc = _to_walls_and_utc(values)
+    assert [x.replace(tzinfo=None) for x in values] == (
+        walls.astype(object).tolist())
+    assert [datetime.datetime(2016, 3, 27, 1, 30, 1, 2),
+            datetime.datetime(1969, 12, 31, 13),
+            datetime.datetime(2016, 2, 29, 12, 15)] == (
+        utc.astype(object).tolist())
+
+
+@pytest.mark.parametrize('period', PERIODS + MONTHLY_PERIODS)
+def test_vectorized__compute__1(DateTime, period):
+    """It returns the same recurrences as the adapter."""
+    context = DateTime(2013, 5, 3, 21, 45)
+    start = DateTime(2014, 4, 1)
+    end = DateTime(2014, 7, 1)
+    recurrences = expected(context, period, start, end)
+    assert recurrences
+    assert_same(compute(context, period, start, end), recurrences)
+
+
+@pytest.mark.parametrize('period', PERIODS + MONTHLY_PERIODS)
+@pytest.mark.parametrize('hour,minute', [(2, 30), (1, 59), (3, 0), (12, 15)])
+def test_vectorized__compute__2(DateTime, period, hour, minute):
+    """It respects DST even for non-existent and ambiguous local times."""
+    for tz in (tz_berlin, tz_new_york, tz_lord_howe):
+        context = DateTime(2016, 1, 3, hour, minute, tzinfo=tz)
+        start = DateTime(2016, 3, 1, tzinfo=tz)
+        end = DateTime(2016, 12, 1, tzinfo=tz)
+        assert_same(compute(context, period, start, end),
+                    expected(context, period, start, end))
+
+
+@pytest.mark.parametrize('period', PERIODS + MONTHLY_PERIODS)
+def test_vectorized__compute__3(DateTime, period):
+    """It does not return recurrences before the context or after the end."""
+    context = DateTime(2014, 4, 18, 21, 45)
+    start = DateTime(2014, 4, 1)
+    assert_same(compute(context, period, start, DateTime(2014, 5, 30)),
+                expected(context, period, start, DateTime(2014, 5, 30)))
+    occurrences = compute(context, period, start, DateTime(2014, 4, 18))
+    assert 0 == len(occurrences)
+    assert [] == occurrences.datetimes()
+
+
+@pytest.mark.parametrize('period', MONTHLY_PERIODS)
+def test_vectorized__compute__5(DateTime, period):
+    """It computes the monthly recurrences of each day of the year.
+
+    This includes the 5th weekday and the last but four weekday which do not
+    exist in each month.
+    """
+    start = DateTime(2015, 12, 20, tzinfo=tz_berlin)
+    end = DateTime(2017, 2, 10, tzinfo=tz_berlin)
+    for day in range(0, 366, 2):
+        context = (DateTime(2015, 1, 1, 20, 30, tzinfo=tz_berlin) +
+                   datetime.timedelta(days=day))
+        context = tz_berlin.normalize(context)
+        assert_same(compute(context, period, start, end),
+                    expected(context, period, start, end))
+
+
+@pytest.mark.parametrize('period', MONTHLY_PERIODS)
+def test_vectorized__compute__6(DateTime, period):
+    """It respects that the time zone of the interval might differ."""
+    context = DateTime(2016, 1, 31, 23, 30, tzinfo=tz_new_york)
+    for start, end in [
+            (DateTime(2016, 3, 1, 5), DateTime(2016, 4, 1, 4)),
+            (DateTime(2016, 2, 29, 4), DateTime(2016, 6, 1, 3, 31)),
+            (DateTime(2016, 3, 31, 4, tzinfo=tz_berlin),
+             DateTime(2016, 6, 1, 5, 31, tzinfo=tz_berlin))]:
+        assert_same(compute(context, period, start, end),
+                    expected(context, period, start, end))
+
+
+@pytest.mark.parametrize('period', PERIODS + MONTHLY_PERIODS)
+def test_vectorized__compute__7(DateTime, period):
+    """It computes the same recurrences for `zoneinfo` time zones.
+
+    This includes the wall times which are ambiguous or do not exist.
+    """
+    zoneinfo = pytest.importorskip('zoneinfo')
+    # The last and the 5th Sunday of January:
+    context = datetime.datetime(
+        2016, 1, 31, 2, 30, tzinfo=zoneinfo.ZoneInfo('Europe/Berlin'))
+    start = DateTime(2016, 3, 1)
+    end = DateTime(2016, 12, 1)
+    occurrences = compute(context, period, start, end)
+    recurrences = expected(context, period, start, end)
+    assert recurrences
+    assert_same(occurrences, recurrences)
+    assert [x.fold for x in recurrences] == [
+        x.fold for x in occurrences.datetimes()]
+
+
+def test_vectorized__compute__4(DateTime):
+    """It raises a `ValueError` for an unsupported period."""
+    with pytest.raises(ValueError):
+        compute(DateTime(2014, 4, 18), 'yearly',
+                DateTime(2014, 4, 1), DateTime(2014, 5, 1))
+
+
+def test_vectorized__compute_many__1(DateTime):
+    """It computes the recurrences of many events at once."""
+    start = DateTime(2016, 3, 1, tzinfo=tz_berlin)
+    end = DateTime(2016, 5, 1, tzinfo=tz_berlin)
+    events = [
+        (DateTime(2016, 1, 3, 2, 30, tzinfo=tz_berlin), 'weekly'),
+        (DateTime(2016, 4, 20, 8), 'daily'),
+        (DateTime(2016, 1, 10, 23, 15, tzinfo=tz_new_york), 'biweekly'),
+        (DateTime(2016, 6, 10), 'daily'),
+        (DateTime(2016, 1, 5, 12, tzinfo=tz_berlin), 'biweekly'),
+        (DateTime(2016, 1, 29, 2, 30, tzinfo=tz_berlin),
+         'nth weekday from end of month'),
+        (DateTime(2016, 2, 1, 9, tzinfo=tz_new_york),
+         'nth weekday every other month'),
+        (DateTime(2016, 6, 1, 9), 'nth weekday of month'),
+    ]
+    occurrences = compute_many(events, start, end)
+    recurrences = [expected(context, period, start, end)
+                   for context, period in events]
+    assert [len(x) for x in recurrences] == numpy.bincount(
+        occurrences.index, minlength=len(events)).tolist()
+    assert_same(occurrences, sum(recurrences, []))
+
+
+def test_vectorized__compute_many__2(DateTime):
+    """It returns no occurrences if there are no events."""
+    occurrences = compute_many(
+        [], DateTime(2016, 3, 1), DateTime(2016, 5, 1))
+    assert 0 == len(occurrences)
+
+
+def test_vectorized__compute_many__3():
+    """It computes the recurrences of naive datetimes taking them as UTC.
+
+    It is the example of the README.
+    """
+    events = [(datetime.datetime(2015, 10, 13, 11, 15), 'weekly'),
+              (datetime.datetime(2015, 10, 20, 8), 'daily'),
+              (datetime.datetime(2015, 10, 6, 9), 'nth weekday of month')]
+    start = datetime.datetime(2015, 10, 14)
+    end = datetime.datetime(2015, 10, 22)
+    occurrences = compute_many(events, start, end)
+    assert [0, 1, 1] == occurrences.index.tolist()
+    assert [datetime.datetime(2015, 10, 20, 11, 15),
+            datetime.datetime(2015, 10, 20, 8),
+            datetime.datetime(2015, 10, 21, 8)] == (
+        occurrences.utc.astype(object).tolist())
+    assert sum((expected(context, period, start, end)
+                for context, period in events), []) == (
+        occurrences.datetimes())
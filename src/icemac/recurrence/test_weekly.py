@@ -3,6 +3,8 @@ from .weekly import Weekly, BiWeekly
 from zope.interface.verify import verifyObject
 import pytest
 import pytz
+import zope.i18n
+import zope.i18n.locales
 
 
 # Fixtures
@@ -154,3 +156,24 @@ def test_weekly__BiWeekly____call____2(DateTime):
 def test_weekly__BiWeekly__info__1(info, recurrence_start):
     """It renders the weekday."""
     assert u'Friday every other week' == info(BiWeekly, recurrence_start)
+
+
+def test_weekly__BiWeekly__get_info__1(recurrence_start):
+    """It renders the weekday using the given locale."""
+    locale = zope.i18n.locales.locales.getLocale('de')
+    assert u'Freitag every other week' == zope.i18n.translate(
+        BiWeekly(recurrence_start).get_info(locale), target_language='en')
+
+
+def test_weekly__Weekly__count__1(random_intervals):
+    """It returns the number of recurrences in the interval."""
+    for dt, start, end in random_intervals:
+        assert len(list(Weekly(dt)(start, end))) == Weekly(dt).count(
+            start, end)
+
+
+def test_weekly__BiWeekly__count__1(random_intervals):
+    """It returns the number of recurrences in the interval."""
+    for dt, start, end in random_intervals:
+        assert len(list(BiWeekly(dt)(start, end))) == BiWeekly(dt).count(
+            start, end)
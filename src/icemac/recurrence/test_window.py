@@ -0,0 +1,63 @@
+from .core import PERIODS
+from .recurrence import get_recurrences_bulk
+from .stats import Stats
+from .window import RecurrenceWindow
+import datetime
+
+
+DAY = datetime.timedelta(days=1)
+
+
+def test_window__RecurrenceWindow__1(DateTime):
+    """It is empty until it gets moved."""
+    window = RecurrenceWindow([('meeting', DateTime(2016, 2, 6), 'daily')])
+    assert 0 == len(window)
+    assert [] == list(window)
+    assert (None, None) == (window.interval_start, window.interval_end)
+
+
+def test_window__RecurrenceWindow__move__1(random_intervals):
+    """It returns the recurrences entering and leaving the window.
+
+    Afterwards the window contains the recurrences not before the start and
+    before the end of the interval.
+    """
+    events = [((number, period), dt, period)
+              for number, (dt, _, _) in enumerate(random_intervals[:10])
+              for period in sorted(PERIODS)]
+    for _, start, end in random_intervals[10:15]:
+        window = RecurrenceWindow(events)
+        previous = []
+        for interval in [(start, end),
+                         (start + 7 * DAY, end + 7 * DAY),
+                         (start + 4 * DAY, end + 4 * DAY),
+                         (start - 40 * DAY, end + 40 * DAY),
+                         (start - 10 * DAY, start + 10 * DAY),
+                         (end + 400 * DAY, end + 500 * DAY),
+                         (end + 450 * DAY, end + 450 * DAY)]:
+            expected = [
+                (key, x) for key, x in get_recurrences_bulk(
+                    events, interval[0] - 2 * DAY, interval[1] + 2 * DAY)
+                if interval[0] <= x < interval[1]]
+            entered, left = window.move(*interval)
+            before, after = set(previous), set(expected)
+            assert [x for x in expected if x not in before] == entered
+            assert [x for x in previous if x not in after] == left
+            assert expected == list(window)
+            assert len(expected) == len(window)
+            assert interval == (window.interval_start, window.interval_end)
+            previous = expected
+
+
+def test_window__RecurrenceWindow__move__2(DateTime):
+    """It only computes the recurrences entering the window."""
+    window = RecurrenceWindow([('meeting', DateTime(2016, 2, 6, 10), 'daily')])
+    window.move(DateTime(2016, 3, 1), DateTime(2016, 6, 1))
+    with Stats() as stats:
+        entered, left = window.move(DateTime(2016, 3, 8), DateTime(2016, 6, 8))
+    assert [('meeting', DateTime(2016, 6, x, 10)) for x in range(1, 8)] == (
+        entered)
+    assert [('meeting', DateTime(2016, 3, x, 10)) for x in range(1, 8)] == (
+        left)
+    # The seven days entering the window and two days before and after them:
+    assert 11 == stats.periods['daily'].recurrences
@@ -2,6 +2,7 @@ from .interfaces import IRecurringDateTime
 from .yearly import Yearly
 from zope.interface.verify import verifyObject
 import pytest
+import pytz
 
 
 # Fixtures
@@ -79,3 +80,59 @@ def test_yearly__Yearly____call____5(DateTime):
     assert [
         DateTime(2011, 2, 28, 15),
         DateTime(2012, 2, 29, 15)] == list(Yearly(dt)(start, end))
+
+
+def test_yearly__Yearly____call____6(DateTime):
+    """It computes the first date in the interval without stepping ...
+
+    ... through all the years since the recurrence start.
+    """
+    dt = DateTime(1514, 12, 24, 15)
+    start = DateTime(2014, 1, 1)
+    end = DateTime(2016, 1, 1)
+    assert [
+        DateTime(2014, 12, 24, 15),
+        DateTime(2015, 12, 24, 15)] == list(Yearly(dt)(start, end))
+
+
+def test_yearly__Yearly____call____7(DateTime):
+    """It handles the 29th of February when seeking the first date."""
+    dt = DateTime(1508, 2, 29, 15)
+    start = DateTime(2011, 2, 28, 15)
+    end = DateTime(2012, 3, 1)
+    assert [
+        DateTime(2011, 2, 28, 15),
+        DateTime(2012, 2, 29, 15)] == list(Yearly(dt)(start, end))
+
+
+def test_yearly__Yearly____call____8(DateTime):
+    """It respects a time zone offset shifting the date into the next year."""
+    dt = DateTime(2010, 12, 31, 23, tzinfo=pytz.timezone('America/New_York'))
+    # In UTC the recurrence in 2013 is already on 2014-01-01, 04:00:
+    start = DateTime(2014, 1, 1, 2)
+    end = DateTime(2015, 1, 1, 5)
+    assert [
+        DateTime(2013, 12, 31, 23, tzinfo=pytz.timezone('America/New_York')),
+        DateTime(2014, 12, 31, 23, tzinfo=pytz.timezone('America/New_York')),
+    ] == list(Yearly(dt)(start, end))
+
+
+def test_yearly__Yearly__count__1(random_intervals):
+    """It returns the number of recurrences in the interval."""
+    for dt, start, end in random_intervals:
+        assert len(list(Yearly(dt)(start, end))) == Yearly(dt).count(
+            start, end)
+
+
+def test_yearly__Yearly__next_after__1(DateTime):
+    """It returns the next recurrence if `instant` is a recurrence."""
+    dt = DateTime(2014, 7, 28, 10)
+    assert DateTime(2016, 7, 28, 10) == Yearly(dt).next_after(
+        DateTime(2015, 7, 28, 10))
+
+
+def test_yearly__Yearly__previous_before__1(DateTime):
+    """It returns `None` if there is no recurrence before `instant`."""
+    dt = DateTime(2014, 7, 28, 10)
+    assert None is Yearly(dt).previous_before(dt)
+    assert dt == Yearly(dt).previous_before(DateTime(2014, 7, 28, 11))
@@ -0,0 +1,360 @@
+"""Vectorized computation of recurrences using NumPy.
+
+This module requires NumPy, install the `numpy` extra to use it. It computes
+the recurrences of the periods with a fix interval (`daily`, `weekly`,
+`biweekly`) and the periods on the nth weekday in month (the four monthly
+periods) as arrays instead of yielding them one by one. The months are
+computed using integer arithmetic on month indices.
+"""
+from . import core
+import datetime
+import numpy
+
+
+ONE_DAY = numpy.timedelta64(1, 'D')
+EPOCH = datetime.date(1970, 1, 1).toordinal()
+ZERO = datetime.timedelta(0)
+SIX_HOURS = numpy.timedelta64(6, 'h')
+
+
+def _to_datetime64(values):
+    """Convert an iterable of naive datetimes to a datetime64 array."""
+    return numpy.array(list(values), dtype='datetime64[us]')
+
+
+def _to_timedelta64(value):
+    """Convert a `datetime.timedelta` to a timedelta64 in microseconds."""
+    return numpy.timedelta64(value, 'us')
+
+
+def _to_walls_and_utc(values):
+    """Convert a list of datetimes to datetime64 arrays.
+
+    Returns the local times and the UTC instants, naive datetimes are taken
+    as UTC. Converting datetime objects is slow in NumPy so the arrays are
+    built from integers.
+    """
+    days = numpy.array([x.toordinal() for x in values], dtype=numpy.int64)
+    microseconds = numpy.array(
+        [((x.hour * 60 + x.minute) * 60 + x.second) * 10 ** 6 + x.microsecond
+         for x in values], dtype=numpy.int64)
+    offsets = numpy.array(
+        [(x.utcoffset() or ZERO).total_seconds() for x in values])
+    walls = ((days - EPOCH).astype('datetime64[D]') +
+             microseconds.astype('timedelta64[us]'))
+    utc = walls - numpy.round(offsets * 10 ** 6).astype(numpy.int64).astype(
+        'timedelta64[us]')
+    return walls, utc
+
+
+def _time_of_day(value):
+    """Return the time of the datetime `value` as `datetime.timedelta`."""
+    return datetime.timedelta(
+        hours=value.hour, minutes=value.minute, seconds=value.second,
+        microseconds=value.microsecond)
+
+
+def localize(tz, walls):
+    """Return the UTC instants of the local `walls` times in `tz`.
+
+    tz ... pytz time zone, an other `tzinfo` implementing PEP 495 or `None`
+           for naive datetimes
+    walls ... datetime64 array of naive local times
+
+    The result is the same as calling `tz.localize()` for each of the wall
+    times and converting it to UTC but it is computed for all of them at once.
+    Time zones implementing PEP 495 like `zoneinfo.ZoneInfo` do not expose
+    their transitions, their wall times are localized one by one using
+    `icemac.recurrence.core.get_localizer()`.
+
+    """
+    return _localize(tz, walls)[0]
+
+
+def _localize(tz, walls):
+    """Return the UTC instants and tzinfo objects of the `walls` in `tz`.
+
+    The tzinfo objects are the ones `tz.localize()` would set. The local
+    times of naive datetimes are taken as UTC, their tzinfo is `None`.
+    """
+    walls = walls.astype('datetime64[us]')
+    if tz is None:
+        return walls, numpy.full(len(walls), None, dtype=object)
+    transitions = getattr(tz, '_utc_transition_times', None)
+    if transitions is None:
+        offset = tz.utcoffset(None)
+        if offset is None:
+            # The offset depends on the wall time, e. g. `zoneinfo.ZoneInfo`:
+            localizer = core.get_localizer(tz)
+            utc = _to_walls_and_utc(
+                [localizer(x) for x in walls.astype(object).tolist()])[1]
+            return utc, numpy.full(len(walls), tz, dtype=object)
+        # UTC or a time zone with a static offset:
+        return (walls - _to_timedelta64(offset),
+                numpy.full(len(walls), tz, dtype=object))
+    times = _to_datetime64(transitions)
+    infos = tz._transition_info
+    offsets = numpy.array([_to_timedelta64(x[0]) for x in infos])
+    dsts = numpy.array([bool(x[1]) for x in infos])
+    tzinfos = numpy.empty(len(infos), dtype=object)
+    tzinfos[:] = [tz._tzinfos[x] for x in infos]
+
+    def info_index(values):
+        """Index of the transition info valid at the UTC `values`."""
+        return numpy.maximum(
+            numpy.searchsorted(times, values, side='right') - 1, 0)
+
+    # Mirror `DstTzInfo.localize()`: There are up to two possible UTC
+    # instants for each wall time. A candidate is valid if converting it back
+    # to the time zone results in the same wall time.
+    candidates = []
+    for delta in (-ONE_DAY, ONE_DAY):
+        offset = offsets[info_index(walls + delta)]
+        utc = walls - offset
+        index = info_index(utc)
+        candidates.append((utc, index, offsets[index] == offset))
+    (utc_a, index_a, valid_a), (utc_b, index_b, valid_b) = candidates
+    use_a = valid_a
+    # At the end of DST a wall time is ambiguous. `localize()` prefers the
+    # candidate without DST, if both are the same it uses the later one:
+    ambiguous = valid_a & valid_b & (utc_a != utc_b)
+    prefer_a = numpy.where(
+        dsts[index_a] != dsts[index_b], ~dsts[index_a], utc_a > utc_b)
+    use_a = numpy.where(ambiguous, prefer_a, use_a)
+    utc = numpy.where(use_a, utc_a, utc_b)
+    result_tzinfos = tzinfos[numpy.where(use_a, index_a, index_b)]
+    # At the start of DST a wall time might not exist. `localize()` uses the
+    # time zone valid six hours before:
+    gap = ~valid_a & ~valid_b
+    if gap.any():
+        gap_utc, result_tzinfos[gap] = _localize(tz, walls[gap] - SIX_HOURS)
+        utc[gap] = gap_utc + SIX_HOURS
+    return utc, result_tzinfos
+
+
+class Occurrences(object):
+    """Recurrences of one or many events as arrays.
+
+    index ... int array, index of the event the recurrence belongs to
+    walls ... datetime64 array of the local times of the recurrences
+    utc ... datetime64 array of the UTC instants of the recurrences
+    tzinfos ... object array of the tzinfo of each recurrence
+
+    """
+
+    def __init__(self, index, walls, utc, tzinfos):
+        self.index = index
+        self.walls = walls
+        self.utc = utc
+        self.tzinfos = tzinfos
+
+    def __len__(self):
+        return len(self.index)
+
+    def datetimes(self):
+        """Return the recurrences as a list of time zone aware datetimes.
+
+        They are the same as the ones computed by the adapters.
+        """
+        tzinfos = self.tzinfos.tolist()
+        # The time zones implementing PEP 495 need `fold` to tell the
+        # instants of an ambiguous wall time apart:
+        fold_zones = set(
+            x for x in set(tzinfos)
+            if x is not None and not hasattr(x, 'localize'))
+        result = []
+        for wall, utc, tzinfo in zip(self.walls.astype(object).tolist(),
+                                     self.utc.astype(object).tolist(),
+                                     tzinfos):
+            value = wall.replace(tzinfo=tzinfo)
+            if tzinfo in fold_zones and value.utcoffset() != wall - utc:
+                value = value.replace(fold=1)
+            result.append(value)
+        return result
+
+
+def _to_utc(value):
+    """Convert an aware datetime to a naive datetime in UTC.
+
+    Naive datetimes are taken as UTC.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.replace(tzinfo=None) - value.utcoffset()
+
+
+def _repeat_arange(counts):
+    """Return the index of the event and the position within the event ...
+
+    ... for each of the `sum(counts)` recurrences.
+    """
+    index = numpy.repeat(numpy.arange(len(counts)), counts)
+    offsets = numpy.cumsum(counts) - counts
+    return index, numpy.arange(len(index)) - numpy.repeat(offsets, counts)
+
+
+def _expand_static(events, interval_start, interval_end):
+    """Compute the local times of recurrences with a fix interval.
+
+    events ... list of (context, class) tuples
+
+    Returns the index in `events` and the local time of each recurrence.
+
+    """
+    starts = []
+    counts = []
+    steps = []
+    times = []
+    for context, class_ in events:
+        recurring = class_(context)
+        start = recurring._get_first_date(interval_start)
+        starts.append(datetime.datetime.combine(start.date(), datetime.time()))
+        counts.append(recurring.count(interval_start, interval_end))
+        steps.append(class_.interval.days)
+        times.append(_time_of_day(context))
+    index, nth = _repeat_arange(numpy.array(counts, dtype=int))
+    days = (nth * numpy.array(steps, dtype=int)[index]).astype(
+        'timedelta64[D]')
+    walls = (_to_datetime64(starts)[index] + days +
+             numpy.array(times, dtype='timedelta64[us]')[index])
+    return index, walls
+
+
+def _expand_monthly(events, interval_start, interval_end):
+    """Compute the local times of recurrences on the nth weekday in month.
+
+    events ... list of (context, class) tuples
+
+    Returns the index in `events`, the local time and the UTC lower bound of
+    each candidate recurrence. Only the candidates whose UTC instant is
+    between the lower bound and the end of the interval are recurrences.
+
+    """
+    walls, utc = _to_walls_and_utc([context for context, class_ in events])
+    classes = [class_ for context, class_ in events]
+    month_intervals = numpy.array(
+        [x.month_interval for x in classes], dtype=int)
+    from_end = numpy.array(
+        [issubclass(x, core.SameNthWeekdayFromEndInMonthBase)
+         for x in classes], dtype=bool)
+    # datetime64 counts the months since 1970-01, 1970-01-01 was a Thursday:
+    context_days = walls.astype('datetime64[D]')
+    context_months = walls.astype('datetime64[M]')
+    weekdays = (context_days.astype(int) + 3) % 7 + 1
+    days = (context_days - context_months.astype('datetime64[D]')).astype(
+        int)
+    lengths = ((context_months + 1).astype('datetime64[D]') -
+               context_months.astype('datetime64[D]')).astype(int)
+    ns = numpy.where(from_end, (lengths - days - 1) // 7 + 1, days // 7)
+    times = walls - context_days
+    # See `SameNthWeekdayInMonthBase._get_first_month()`:
+    start_month = core.month_index(
+        interval_start.date() - core.TWO_DAYS) - 1970 * 12
+    end_month = core.month_index(interval_end) - 1970 * 12
+    first_months = start_month + (
+        start_month - context_months.astype(int)) % month_intervals
+    # The recurrences in the month after the end of the interval might be
+    # before its end in UTC:
+    counts = numpy.maximum(
+        0, (end_month + 1 - first_months) // month_intervals + 1)
+    end_utc = numpy.datetime64(_to_utc(interval_end), 'us')
+    # No need to compute the events after the interval, there will be no
+    # results:
+    counts[utc > end_utc] = 0
+    lower_bounds = numpy.maximum(
+        utc, numpy.datetime64(_to_utc(interval_start), 'us'))
+    index, nth = _repeat_arange(counts)
+    months = first_months[index] + nth * month_intervals[index]
+    # Tables of the first day, its weekday and the length of the months in
+    # the interval:
+    min_month = months.min() if len(months) else 0
+    table = numpy.arange(min_month, end_month + 2).astype('datetime64[M]')
+    first_table = table.astype('datetime64[D]')
+    length_table = ((table + 1).astype('datetime64[D]') - first_table).astype(
+        int)
+    weekday_table = (first_table.astype(int) + 3) % 7 + 1
+    months -= min_month
+    lengths = length_table[months]
+    days = (weekdays[index] - weekday_table[months]) % 7
+    ns = ns[index]
+    recurrences = (lengths - days + 6) // 7
+    ns = numpy.where(from_end[index], recurrences - ns, ns)
+    days += 7 * ns
+    # Skip the months where the day swaps into an other month:
+    valid = (days >= 0) & (days < lengths)
+    index = index[valid]
+    walls = (first_table[months[valid]] +
+             days[valid].astype('timedelta64[D]') + times[index])
+    return index, walls, lower_bounds[index]
+
+
+def compute(context, period, interval_start, interval_end):
+    """Compute the recurrences of `context` within the interval.
+
+    Returns an `Occurrences` instance. Raises a `ValueError` if `period` is
+    not supported, see `compute_many()`.
+
+    """
+    return compute_many([(context, period)], interval_start, interval_end)
+
+
+def compute_many(events, interval_start, interval_end):
+    """Compute the recurrences of many events within the interval.
+
+    events ... iterable of (datetime, period) tuples, `period` has to be one
+               of the periods with a fix interval or one of the periods on
+               the nth weekday in month
+    interval_start ... date, part of the interval
+    interval_end ... date, _not_ part of the interval
+
+    Returns an `Occurrences` instance. Its `index` is the position of the
+    event in `events`, the recurrences are sorted by it.
+
+    """
+    static = []
+    static_numbers = []
+    monthly = []
+    monthly_numbers = []
+    zones = []
+    for number, (context, period) in enumerate(events):
+        class_ = core.PERIODS[period]
+        if issubclass(class_, core.StaticIntervalBase):
+            static.append((context, class_))
+            static_numbers.append(number)
+        elif issubclass(class_, core.SameNthWeekdayInMonthBase):
+            monthly.append((context, class_))
+            monthly_numbers.append(number)
+        else:
+            raise ValueError('Period {!r} is not supported.'.format(period))
+        zones.append(context.tzinfo)
+    static_index, static_walls = _expand_static(
+        static, interval_start, interval_end)
+    monthly_index, monthly_walls, lower_bounds = _expand_monthly(
+        monthly, interval_start, interval_end)
+    index = numpy.concatenate([
+        numpy.array(static_numbers, dtype=int)[static_index],
+        numpy.array(monthly_numbers, dtype=int)[monthly_index]])
+    walls = numpy.concatenate([static_walls, monthly_walls])
+    # Localize the recurrences of all events in the same time zone at once:
+    numbers = {}
+    zone_numbers = numpy.array(
+        [numbers.setdefault(tz, len(numbers)) for tz in zones],
+        dtype=int)[index]
+    utc = numpy.empty_like(walls)
+    tzinfos = numpy.empty(len(walls), dtype=object)
+    for tz, number in numbers.items():
+        mask = zone_numbers == number
+        utc[mask], tzinfos[mask] = _localize(tz, walls[mask])
+    # The candidates of the monthly recurrences are restricted to the ones
+    # in the interval and not before their event:
+    keep = numpy.ones(len(walls), dtype=bool)
+    monthly_utc = utc[len(static_walls):]
+    keep[len(static_walls):] = (
+        (monthly_utc >= lower_bounds) &
+        (monthly_utc < numpy.datetime64(_to_utc(interval_end), 'us')))
+    selection = numpy.flatnonzero(keep)
+    if static and monthly:
+        # Order the recurrences of both kinds by the event:
+        selection = selection[numpy.argsort(index[selection], kind='stable')]
+    return Occurrences(index[selection], walls[selection], utc[selection],
+                       tzinfos[selection])
@@ -0,0 +1,96 @@
+"""Recurrences of many events in a window moving along the time line.
+
+A calendar scrolled by a week still shows most of the recurrences it showed
+before. `RecurrenceWindow` keeps the recurrences of its interval and only
+computes the ones entering it when it moves.
+"""
+from .cache import MARGIN
+from .recurrence import _lookup_factory
+import bisect
+
+
+def _compute(recurring, interval_start, interval_end):
+    """Compute the recurrences not before the start and before the end.
+
+    The recurrences are computed for a few more days around the interval,
+    see `icemac.recurrence.cache.MARGIN`.
+    """
+    recurrences = recurring(interval_start - MARGIN, interval_end + MARGIN)
+    return [x for x in recurrences if interval_start <= x < interval_end]
+
+
+class RecurrenceWindow(object):
+    """Recurrences of many events within an interval which can be moved.
+
+    events ... iterable of (key, datetime, period) tuples, `key` is an
+               arbitrary value identifying the event
+
+    The window is empty until `move()` is called for the first time. It keeps
+    state, so do not share it between threads without locking.
+    """
+
+    def __init__(self, events):
+        self.interval_start = None
+        self.interval_end = None
+        self._events = [(key, _lookup_factory(datetime, period)(datetime))
+                        for key, datetime, period in events]
+        # The recurrences in the interval of each event:
+        self._recurrences = [[] for x in self._events]
+
+    def __len__(self):
+        return sum(len(x) for x in self._recurrences)
+
+    def __iter__(self):
+        """Iterate over the (key, datetime) tuples in the order of events."""
+        for (key, _), recurrences in zip(self._events, self._recurrences):
+            for recurrence in recurrences:
+                yield key, recurrence
+
+    def move(self, interval_start, interval_end):
+        """Move the window to the interval.
+
+        interval_start ... date, part of the interval
+        interval_end ... date, _not_ part of the interval
+
+        Returns the lists of the (key, datetime) tuples entering and leaving
+        the window each in the order of the events. The window contains the
+        recurrences which are not before `interval_start` and before
+        `interval_end`. Only the recurrences in the parts of the interval
+        which were not in the window before get computed, so the costs are
+        proportional to the distance moved.
+
+        """
+        lower = upper = None
+        if self.interval_start is not None:
+            # The part of the interval which is already in the window:
+            lower = max(interval_start, self.interval_start)
+            upper = min(interval_end, self.interval_end)
+            if lower >= upper:
+                lower = upper = None
+        entered = []
+        left = []
+        for (key, recurring), recurrences in zip(
+                self._events, self._recurrences):
+            if lower is None:
+                left.extend((key, x) for x in recurrences)
+                recurrences[:] = _compute(
+                    recurring, interval_start, interval_end)
+                entered.extend((key, x) for x in recurrences)
+                continue
+            begin = bisect.bisect_left(recurrences, lower)
+            end = bisect.bisect_left(recurrences, upper)
+            left.extend((key, x) for x in recurrences[:begin])
+            left.extend((key, x) for x in recurrences[end:])
+            del recurrences[end:]
+            del recurrences[:begin]
+            if interval_start < lower:
+                before = _compute(recurring, interval_start, lower)
+                recurrences[:0] = before
+                entered.extend((key, x) for x in before)
+            if upper < interval_end:
+                after = _compute(recurring, upper, interval_end)
+                recurrences.extend(after)
+                entered.extend((key, x) for x in after)
+        self.interval_start = interval_start
+        self.interval_end = interval_end
+        return entered, left